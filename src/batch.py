@@ -0,0 +1,117 @@
+import collections
+from array import array
+import numpy as np
+import engine
+from utils import Table
+from vector import V2
+from points import PointArray
+
+# Convert `points`, an (n, 2) array-like of int or float coordinates, into
+# two flat lists of native Python numbers. Scalar indexing into lists is much
+# cheaper than indexing into a NumPy array, and the conversion itself happens
+# in bulk. A `PointArray` is read column by column without building `V2`s, and
+# a list of `V2` is read point by point.
+def columns(points):
+    if isinstance(points, PointArray) or (isinstance(points, list) and (
+        (not points) or isinstance(points[0], V2)
+    )): return engine.columns(points)
+    points = np.asarray(points)
+    if points.ndim != 2 or points.shape[1] != 2:
+        raise ValueError(f"expected an (n, 2) array, got {points.shape}")
+    if points.dtype.kind not in "iuf":
+        raise TypeError(f"expected numeric coordinates, got {points.dtype}")
+    return points[:, 0].tolist(), points[:, 1].tolist()
+
+# Run the Melkman algorithm over a whole chain at once.
+# `points` is an (n, 2) array of coordinates forming a simple polygonal chain.
+# The result is identical to `Melkman(spc).run()`: `indices` matches
+# `[p.index for p in m.hull]` and `rotation` matches `m.rotation`.
+# Complexity: O(n)
+def hull(points):
+    xs, ys = columns(points)
+    dq = collections.deque()
+    rotation = engine.select(xs, ys)(xs, ys, 0, len(xs), dq)
+    return Table(
+        indices  = np.fromiter(dq, dtype = np.intp, count = len(dq)),
+        rotation = rotation,
+    )
+
+# Hulls of the chains `xs[offsets[k]:offsets[k + 1]]` (same for `ys`), with
+# one deque and one output buffer shared by all chains. Indices are relative
+# to the start of each chain. Executed in worker processes by `hulls`, which
+# sends packed columns (`array`).
+# Complexity: O(n)
+def ragged(xs, ys, offsets):
+    if not isinstance(xs, list): xs, ys = xs.tolist(), ys.tolist()
+    melkman = engine.select(xs, ys)
+    dq = collections.deque()
+    indices = array("q")
+    sizes = array("q")
+    rotations = array("b")
+    for k in range(len(offsets) - 1):
+        first = offsets[k]
+        rotations.append(melkman(xs, ys, first, offsets[k + 1], dq))
+        sizes.append(len(dq))
+        indices.extend(i - first for i in dq)
+    return indices, sizes, rotations
+
+# Concatenate `chains` (anything `columns` accepts) into flat coordinate
+# lists and the offsets of each chain.
+def concatenate(chains):
+    xs, ys, offsets = [], [], [0]
+    for chain in chains:
+        cx, cy = columns(chain)
+        xs.extend(cx)
+        ys.extend(cy)
+        offsets.append(len(xs))
+    return xs, ys, offsets
+
+# Hulls of many chains in one call.
+# `chains` is either a list of chains (each one anything `columns` accepts),
+# or, if `offsets` is given, an (n, 2) array of all the chains' points laid
+# end to end: chain `k` is `chains[offsets[k]:offsets[k + 1]]`.
+# With `workers` > 1, contiguous groups of chains are processed in a pool of
+# worker processes; the result does not depend on `workers`.
+# Returns a Table of flat arrays: the hull of chain `k` is
+# `indices[hull_offsets[k]:hull_offsets[k + 1]]`, as indices into chain `k`,
+# in the order of `Melkman.hull`, and its rotation is `rotations[k]`.
+# Complexity: O(n)
+def hulls(chains, offsets = None, workers = None):
+    if offsets is None: xs, ys, offsets = concatenate(chains)
+    else:
+        xs, ys = columns(chains)
+        offsets = np.asarray(offsets, dtype = np.intp).tolist()
+        if (not offsets) or (offsets[0] != 0) or (offsets[-1] != len(xs)) \
+        or any(a > b for a, b in zip(offsets, offsets[1:])): raise ValueError(
+            "offsets must rise from 0 to the number of points"
+        )
+
+    m = len(offsets) - 1
+    if (workers is None) or (workers <= 1) or (m < 2):
+        parts = [ragged(xs, ys, offsets)]
+    else:
+        import concurrent.futures
+        # A few groups per worker to even out the load.
+        groups = min(m, 4 * workers)
+        bounds = [m * g // groups for g in range(groups + 1)]
+        # Coordinates travel as packed int64 or float64 columns.
+        code = "q" if engine.integral(xs, ys) else "d"
+        with concurrent.futures.ProcessPoolExecutor(workers) as executor:
+            parts = list(executor.map(ragged, *zip(*(
+                (array(code, xs[offsets[a]:offsets[b]]),
+                 array(code, ys[offsets[a]:offsets[b]]),
+                 [o - offsets[a] for o in offsets[a:b + 1]])
+                for a, b in zip(bounds, bounds[1:])
+            ))))
+
+    sizes = np.concatenate([np.frombuffer(p[1], dtype = np.int64)
+                            for p in parts])
+    hull_offsets = np.zeros(m + 1, dtype = np.intp)
+    np.cumsum(sizes, out = hull_offsets[1:])
+    return Table(
+        offsets   = hull_offsets,
+        indices   = np.concatenate([np.frombuffer(p[0], dtype = np.int64)
+                                    for p in parts]).astype(np.intp),
+        rotations = np.concatenate([np.frombuffer(p[2], dtype = np.int8)
+                                    for p in parts]),
+    )
@@ -0,0 +1,595 @@
+import gc
+import os
+import sys
+import json
+import math
+import argparse
+import tempfile
+import random
+import time
+import timeit
+import kernel
+import tracemalloc
+from utils import Table
+from vector import V2
+import chainio
+from points import PointArray
+from spc import SimplePolygonalChain as SPC
+from melkman import Melkman, SlidingWindow
+import validate
+
+# Memory needed to hold `n` random points, as a list of `V2` and as a
+# `PointArray`.
+def memory(ns = (10**4, 10**5, 10**6)):
+    def measure(build, n):
+        tracemalloc.start()
+        spc = build(n)
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del spc
+        return size
+
+    def v2_list(n): return [
+        V2(random.randrange(800), random.randrange(600), index = i)
+        for i in range(n)
+    ]
+
+    def point_array(n):
+        spc = PointArray()
+        for i in range(n): spc.append(V2(
+            random.randrange(800), random.randrange(600), index = i
+        ))
+        return spc
+
+    print(f"{'n':>9} {'list[V2]':>12} {'PointArray':>12} {'ratio':>6}")
+    for n in ns:
+        a = measure(v2_list, n)
+        b = measure(point_array, n)
+        print(f"{n:>9} {a / 2**20:>10.2f}MB {b / 2**20:>10.2f}MB {a / b:>6.1f}")
+
+# Orientation and intersection tests, as implemented before `kernel` (V2
+# temporaries) and after (`V2` wrappers, raw `kernel` calls).
+def predicates(number = 200_000):
+    def rotation_before(a, b, c): return V2.sign(V2.cross(b - a, c - a))
+
+    def position_before(a, b, c):
+        inside = (V2.dot(a - c, b - c) <= 0)
+        behind = (V2.dot(b - a, c - a) < 0)
+        return 0 if inside else -1 if behind else 1
+
+    def intersection_before(a, b, c, d):
+        ca = a - c ; ab = b - a ; cd = d - c
+        denominator = V2.cross(cd, ab)
+        if b == c: return (denominator == 0) \
+                      and (position_before(a, b, d) <= 0)
+        if denominator == 0:
+            colinear = (V2.cross(ca, cd) == 0)
+            overlap = (position_before(a, b, c) == 0) \
+                   or (position_before(a, b, d) == 0) \
+                   or (position_before(c, d, a) == 0) \
+                   or (position_before(c, d, b) == 0)
+            return colinear and overlap
+        u = V2.cross(ca, cd) / denominator
+        v = V2.cross(ca, ab) / denominator
+        return (0 <= u <= 1) and (0 <= v <= 1)
+
+    a, b, c, d = V2(3, 7), V2(250, 40), V2(120, 300), V2(90, -20)
+    cases = {
+        "rotation before":     lambda: rotation_before(a, b, c),
+        "rotation V2":         lambda: V2.rotation(a, b, c),
+        "rotation kernel":     lambda: kernel.rotation(
+            a.x, a.y, b.x, b.y, c.x, c.y
+        ),
+        "intersection before": lambda: intersection_before(a, b, c, d),
+        "intersection V2":     lambda: V2.intersection(a, b, c, d),
+        "intersection kernel": lambda: kernel.intersection(
+            a.x, a.y, b.x, b.y, c.x, c.y, d.x, d.y
+        ),
+    }
+    for name, f in cases.items():
+        t = min(timeit.repeat(f, number = number, repeat = 3))
+        print(f"{name:<20} {t / number * 1e9:>8.0f} ns/call")
+
+# Cost of exact predicates: integer inputs, float inputs decided by the
+# floating-point filter, and (nearly) collinear float inputs which fall back
+# to exact arithmetic. "naive" is the unfiltered float expression.
+def robust(number = 100_000):
+    def naive(ax, ay, bx, by, cx, cy):
+        d = (bx - ax) * (cy - ay) - (by - ay) * (cx - ax)
+        return 1 if d > 0 else -1 if d < 0 else 0
+
+    integers = (3, 7, 250, 40, 120, 300)
+    floats   = (0.1, 0.7, 25.3, 4.2, 12.9, 30.1)
+    # c on the segment ab, up to rounding.
+    t = 0.3
+    near = (0.1, 0.7, 25.3, 4.2, 0.1 + t * 25.2, 0.7 + t * 3.5)
+    cases = {
+        "naive float":       lambda: naive(*floats),
+        "rotation integer":  lambda: kernel.rotation(*integers),
+        "rotation float":    lambda: kernel.rotation(*floats),
+        "rotation fallback": lambda: kernel.rotation(*near),
+        "intersection float": lambda: kernel.intersection(
+            *floats, 30.0, -2.0
+        ),
+        "intersection fallback": lambda: kernel.intersection(
+            *near, 30.0, -2.0
+        ),
+    }
+    for name, f in cases.items():
+        t = min(timeit.repeat(f, number = number, repeat = 3))
+        print(f"{name:<22} {t / number * 1e9:>8.0f} ns/call")
+
+    # Share of rotation tests falling back on a random float chain.
+    exact, rotation = kernel.exact, kernel.rotation
+    counts = [0, 0]
+    def counted_exact(*args):
+        counts[0] += 1
+        return exact(*args)
+    def counted_rotation(*args):
+        counts[1] += 1
+        return rotation(*args)
+    rng = random.Random(0)
+    spc = [V2(rng.random(), rng.random(), index = i) for i in range(10000)]
+    kernel.exact, kernel.rotation = counted_exact, counted_rotation
+    try: Melkman(spc, history = 0).run()
+    finally: kernel.exact, kernel.rotation = exact, rotation
+    fallbacks, calls = counts
+    print(f"fallbacks on random floats: {fallbacks} / {calls} rotations")
+
+# Chain generators: rejection sampling (`generate`) against the
+# by-construction generators. Reports the length actually produced.
+def generators(ns = (300, 3000, 30000, 300000)):
+    area = Table(x = 0, y = 0, width = 800, height = 600)
+    def rejection(area, n, seed):
+        random.seed(seed)
+        return SPC.generate(area, n)
+
+    cases = {
+        "generate": rejection,
+        "monotone": SPC.monotone,
+        "star":     SPC.star,
+    }
+    print(f"{'n':>7} {'generator':<9} {'time':>9} {'length':>7}")
+    for n in ns:
+        for name, gen in cases.items():
+            if (name == "generate") and (n > 30000): continue
+            t = timeit.default_timer()
+            spc = gen(area, n, seed = 0)
+            t = timeit.default_timer() - t
+            print(f"{n:>7} {name:<9} {t * 1e3:>7.1f}ms {len(spc):>7}")
+
+# Memory footprint of `Melkman.history` for each retention policy, compared
+# to the former layout (one `Table` holding two lists per entry).
+def history(n = 100_000):
+    spc = SPC.star(Table(x = 0, y = 0, width = 2000, height = 2000), n, 0)
+    def table_nbytes(h): return sys.getsizeof(h) + sum(
+        sys.getsizeof(t) + sys.getsizeof(t.__dict__)
+        + sys.getsizeof(t.left) + sys.getsizeof(t.right)
+        for t in (
+            Table(index = e.index, left = list(e.left), right = list(e.right))
+            for e in h
+        )
+    )
+
+    print(f"{'policy':<10} {'entries':>8} {'compact':>10} {'Table':>10}")
+    for policy in (None, 10_000, 100, 0):
+        m = Melkman(spc, history = policy)
+        m.run()
+        print(
+            f"{str(policy):<10} {len(m.history):>8}"
+            f" {m.history.nbytes() / 2**10:>8.0f}kB"
+            f" {table_nbytes(m.history) / 2**10:>8.0f}kB"
+        )
+
+# Many small chains: a loop over `Melkman.run` against `batch.hulls`, from
+# lists of `V2` and from one ragged array, serial and in worker processes.
+def chains(count = 5000, n = 100, workers = (2, 4)):
+    import numpy as np
+    import batch
+    area = Table(x = 0, y = 0, width = 800, height = 600)
+    spcs = [SPC.star(area, n, seed) for seed in range(count)]
+    flat = np.array([(p.x, p.y) for spc in spcs for p in spc])
+    offsets = np.arange(0, len(flat) + 1, n)
+
+    def loop():
+        for spc in spcs: Melkman(spc, history = 0).run()
+
+    cases = {
+        "Melkman.run loop":   loop,
+        "batch lists":        lambda: batch.hulls(spcs),
+        "batch ragged array": lambda: batch.hulls(flat, offsets),
+    }
+    for w in workers: cases[f"batch ragged, {w} workers"] = \
+        lambda w = w: batch.hulls(flat, offsets, workers = w)
+
+    print(f"{count} chains of {n} points")
+    for name, f in cases.items():
+        t = min(timeit.repeat(f, number = 1, repeat = 3))
+        print(f"{name:<26} {t * 1e3:>8.1f}ms {count / t:>10.0f} chains/s")
+
+# One long chain: the serial index-based engine (which the workers run on
+# each part) against `parallel.hull`, after checking that both give the same
+# vertices. The speedup is bounded by the number of CPUs.
+def split(n = 300_000, workers = (1, 2, 4, 8)):
+    import engine
+    import parallel
+    spc = SPC.star(Table(x = 0, y = 0, width = 4000, height = 4000), n, 0)
+    expected = parallel.strict(spc, *engine.hull(spc))
+    for w in workers:
+        if parallel.hull(spc, workers = w) != expected: sys.exit(
+            f"parallel.hull with {w} workers differs from engine.hull"
+        )
+    cases = {"serial engine": lambda: engine.hull(spc)}
+    for w in workers: cases[f"parallel, {w} workers"] = \
+        lambda w = w: parallel.hull(spc, workers = w)
+
+    print(f"{n} points, {os.cpu_count()} CPUs")
+    base = None
+    for name, f in cases.items():
+        t = min(timeit.repeat(f, number = 1, repeat = 3))
+        base = base or t
+        print(f"{name:<22} {t * 1e3:>8.1f}ms {base / t:>6.2f}x")
+
+# Hull of the last `size` points of a stream: `SlidingWindow` against
+# rerunning the algorithm on the window after each point.
+def window(n = 20_000, sizes = (10, 100, 1000)):
+    spc = SPC.star(Table(x = 0, y = 0, width = 2000, height = 2000), n, 0)
+    print(f"{'size':>6} {'window':>12} {'rerun':>12}")
+    for size in sizes:
+        def sliding():
+            w = SlidingWindow(size)
+            for p in spc: w.push(p) ; w.hull
+        def rerun():
+            # Every 10th point only, scaled back.
+            for k in range(0, n, 10):
+                Melkman(spc[max(0, k + 1 - size) : k + 1], history = 0).run()
+        a = min(timeit.repeat(sliding, number = 1, repeat = 3))
+        b = 10 * min(timeit.repeat(rerun, number = 1, repeat = 3))
+        print(f"{size:>6} {a / n * 1e6:>9.1f}us {b / n * 1e6:>9.1f}us")
+
+# Saving and loading checkpoints of a run stopped halfway, keeping all, part
+# or none of the history, against reprocessing the first half of the chain.
+def checkpoints(n = 200_000, keeps = (None, 1000, 0)):
+    import checkpoint
+    spc = SPC.star(Table(x = 0, y = 0, width = 2000, height = 2000), n, 0)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "chain")
+        chainio.save(path, spc)
+        mapped = chainio.load(path)
+        m = Melkman(mapped)
+        for _ in range(n // 2): m.next()
+
+        def rerun():
+            r = Melkman(mapped)
+            for _ in range(n // 2): r.next()
+        t = min(timeit.repeat(rerun, number = 1, repeat = 3))
+        print(f"reprocess {n // 2} points: {t * 1e3:.1f}ms")
+
+        print(f"{'history':>8} {'size':>10} {'save':>10} {'load':>10}")
+        for keep in keeps:
+            target = os.path.join(directory, "checkpoint")
+            save = min(timeit.repeat(
+                lambda: checkpoint.save(target, m, keep),
+                number = 1, repeat = 3,
+            ))
+            load = min(timeit.repeat(
+                lambda: checkpoint.load(target, chainio.load(path)),
+                number = 1, repeat = 3,
+            ))
+            print(
+                f"{str(keep):>8} {os.path.getsize(target) / 2**10:>8.0f}kB"
+                f" {save * 1e3:>8.2f}ms {load * 1e3:>8.2f}ms"
+            )
+
+# Hull at any step: building a `Timeline`, random queries and scrubbing
+# (consecutive queries), against rewinding the history from the end.
+def timeline(n = 100_000, queries = 1000):
+    from timeline import Timeline
+    spc = SPC.star(Table(x = 0, y = 0, width = 2000, height = 2000), n, 0)
+    rng = random.Random(0)
+    ks = [rng.randrange(n) for _ in range(queries)]
+
+    start = time.perf_counter()
+    index = Timeline(spc)
+    print(f"build: {(time.perf_counter() - start) * 1e3:.1f}ms,"
+          f" {len(index.marks)} checkpoints,"
+          f" {sum(map(len, index.hulls))} points stored")
+
+    def random_access():
+        for k in ks: index.at(k)
+    def scrub():
+        for k in range(n // 2, n // 2 + queries): index.at(k)
+    def rewind():
+        m = Melkman(spc)
+        m.run()
+        while m.iter.i > n // 2: m.rewind()
+    cases = {
+        "random":          (random_access, queries),
+        "scrub":           (scrub, queries),
+        "run, rewind":     (rewind, 1),
+    }
+    for name, (f, count) in cases.items():
+        t = min(timeit.repeat(f, number = 1, repeat = 3))
+        print(f"{name:<16} {t / count * 1e6:>10.1f}us/query")
+
+# Integer engine against the generic paths on an integer chain: `Melkman`
+# on `V2`s, the index-based generic engine and the integer engine, from
+# lists and from a packed int64 `PointArray`.
+def engines(ns = (10**4, 10**5, 10**6)):
+    import collections
+    import engine
+    print(f"{'n':>8} {'Melkman':>10} {'generic':>10} {'integer':>10}"
+          f" {'int64 array':>12}")
+    for n in ns:
+        spc = SPC.star(Table(x = 0, y = 0, width = 4000, height = 4000), n, 0)
+        packed = PointArray.from_points(spc, typecode = "q")
+        xs, ys = engine.columns(spc)
+        dq = collections.deque()
+        cases = [
+            lambda: Melkman(spc, history = 0).run(),
+            lambda: engine.melkman(xs, ys, 0, n, dq),
+            lambda: engine.integer(xs, ys, 0, n, dq),
+            lambda: engine.hull(packed),
+        ]
+        times = [min(timeit.repeat(f, number = 1, repeat = 3)) for f in cases]
+        print(f"{n:>8} " + " ".join(
+            f"{t * 1e3:>8.1f}ms" for t in times[:3]
+        ) + f" {times[3] * 1e3:>10.1f}ms"
+          + f"  ({times[0] / times[2]:.1f}x)")
+
+# Saving and loading chains as text and in the binary format (mapped in
+# memory as a `PointArray` or with NumPy).
+def io(ns = (10**4, 10**5, 10**6)):
+    def timed(f, *args):
+        t = timeit.default_timer()
+        result = f(*args)
+        return result, timeit.default_timer() - t
+
+    print(f"{'n':>8} {'operation':<18} {'time':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        text = os.path.join(tmp, "chain.txt")
+        binary = os.path.join(tmp, "chain.spc")
+        for n in ns:
+            spc = PointArray.from_points(
+                (random.randrange(10**6), random.randrange(10**6))
+                for _ in range(n)
+            )
+            cases = [
+                ("save text",        chainio.save_text, text, spc),
+                ("save binary",      chainio.save, binary, spc),
+                ("load text",        chainio.load_text, text),
+                ("load binary",      chainio.load, binary),
+                ("load numpy",       chainio.load_numpy, binary),
+                ("scan binary",      lambda: sum(chainio.load(binary).xs)),
+            ]
+            for name, f, *args in cases:
+                _, t = timed(f, *args)
+                print(f"{n:>8} {name:<18} {t * 1e3:>8.2f}ms")
+
+# Chain shapes of the suite, as functions of `n` and a seed. Coordinates are
+# integers, unbounded when the shape needs it.
+# * random: random points sorted by angle (`SimplePolygonalChain.star`).
+# * convex: points of a parabola, every point is on the hull.
+# * spiral: square spiral with a spacing of 2.
+# * zigzag: x-monotone chain alternating between two noisy bands.
+def random_shape(n, seed):
+    side = max(64, 4 * math.isqrt(n))
+    return SPC.star(Table(x = 0, y = 0, width = side, height = side), n, seed)
+
+def convex_shape(n, seed):
+    return [V2(i, i * i, index = i) for i in range(n)]
+
+def spiral_shape(n, seed):
+    spc, x, y, dx, dy, length = [], 0, 0, 2, 0, 1
+    while len(spc) < n:
+        for _ in range(2):
+            for _ in range(length):
+                if len(spc) == n: break
+                spc.append(V2(x, y, index = len(spc)))
+                x, y = x + dx, y + dy
+            dx, dy = -dy, dx
+        length += 1
+    return spc
+
+def zigzag_shape(n, seed):
+    rng = random.Random(seed)
+    return [
+        V2(i, (i % 2) * 1000 + rng.randrange(100), index = i)
+        for i in range(n)
+    ]
+
+SHAPES = {
+    "random": random_shape,
+    "convex": convex_shape,
+    "spiral": spiral_shape,
+    "zigzag": zigzag_shape,
+}
+
+# Operations of the suite. Each one takes a chain and returns a function
+# performing the measured work (the set-up is not measured), or None when
+# the operation does not apply. `limit(n, h)` bounds the quadratic ones.
+def op_run(spc):
+    m = Melkman(spc)
+    return m.run
+
+def op_add(spc):
+    m = Melkman([])
+    def add():
+        for p in spc: m.add((p.x, p.y))
+    return add
+
+def op_generate(spc):
+    area = Table(x = 0, y = 0, width = 800, height = 600)
+    return lambda: SPC.generate(area, len(spc), seed = 0)
+
+def op_check_1(spc):
+    head, p = spc[:-1], spc[-1]
+    return lambda: SPC.check_1(head, p)
+
+def ran(spc, **kwargs):
+    m = Melkman(spc, **kwargs)
+    m.run()
+    return m
+
+def op_check(spc): return ran(spc).check
+
+def op_validate(spc):
+    m = ran(spc)
+    return lambda: validate.check(m)
+
+def halves(spc):
+    m = Melkman(spc)
+    for _ in range(len(spc) // 2): m.next()
+    return m
+
+def op_split(spc): return halves(spc).split
+
+def op_bridge(spc):
+    m1, m2 = halves(spc).split()
+    m1.run()
+    m2.run()
+    return lambda: m1.bridge(m2)
+
+def op_rewind(spc):
+    m = ran(spc)
+    def rewind():
+        while m.history: m.rewind()
+    return rewind
+
+# name: (operation, shapes, largest n as a function of n and h).
+OPERATIONS = {
+    "run":      (op_run,      SHAPES, lambda n, h: True),
+    "add":      (op_add,      SHAPES, lambda n, h: n <= 10**4),
+    "generate": (op_generate, ["random"], lambda n, h: n <= 10**4),
+    "check_1":  (op_check_1,  SHAPES, lambda n, h: True),
+    "check":    (op_check,    SHAPES, lambda n, h: n * h <= 10**7),
+    "validate": (op_validate, SHAPES, lambda n, h: True),
+    "split":    (op_split,    SHAPES, lambda n, h: True),
+    "bridge":   (op_bridge,   SHAPES, lambda n, h: True),
+    "rewind":   (op_rewind,   SHAPES, lambda n, h: True),
+}
+
+# Run every operation on every shape for n = 10^2 ... `max_n`, keeping the
+# best of `repeat` runs. Returns a list of records.
+def suite(max_n = 10**5, repeat = 3, operations = None, shapes = None):
+    records = []
+    ns = [10**k for k in range(2, 7) if 10**k <= max_n]
+    for shape in shapes or SHAPES:
+        for n in ns:
+            spc = SHAPES[shape](n, 0)
+            h = len(ran(spc, history = 0).hull)
+            for name in operations or OPERATIONS:
+                op, applies, limit = OPERATIONS[name]
+                if (shape not in applies) or not limit(n, h): continue
+                best = math.inf
+                for _ in range(repeat):
+                    f = op(spc)
+                    gc.collect()
+                    gc.disable()
+                    t = timeit.default_timer()
+                    f()
+                    best = min(best, timeit.default_timer() - t)
+                    gc.enable()
+                records.append(dict(
+                    op = name, shape = shape, n = n, h = h,
+                    seconds = best, ns_per_point = best / n * 1e9,
+                ))
+                print(
+                    f"{name:<9} {shape:<7} {n:>8} h={h:<8}"
+                    f" {best * 1e3:>10.2f}ms"
+                    f" {best / n * 1e9:>10.0f}ns/point",
+                    flush = True,
+                )
+    return records
+
+# Flag operations whose cost per point grows with n although they are
+# linear: the O(1)-per-step claim of `run` (and `split`, `rewind`) is broken
+# if the cost per point at the largest n exceeds `factor` times the cost at
+# n = 10^3.
+LINEAR = ("run", "split", "rewind")
+def scaling(records, factor = 3.0):
+    issues = []
+    for op in LINEAR:
+        for shape in SHAPES:
+            rs = sorted(
+                (r for r in records
+                 if (r["op"] == op) and (r["shape"] == shape)
+                 and (r["n"] >= 10**3)),
+                key = lambda r: r["n"],
+            )
+            if len(rs) < 2: continue
+            ratio = rs[-1]["ns_per_point"] / rs[0]["ns_per_point"]
+            if ratio > factor: issues.append(
+                f"{op}/{shape}: {ratio:.1f}x slower per point at"
+                f" n={rs[-1]['n']} than at n={rs[0]['n']}"
+            )
+    return issues
+
+# Compare two result files. Returns the list of (op, shape, n) entries which
+# got slower by more than `threshold`.
+def compare(old, new, threshold = 1.2):
+    def key(r): return (r["op"], r["shape"], r["n"])
+    before = {key(r): r for r in old["records"]}
+    regressions = []
+    print(f"{'op':<9} {'shape':<7} {'n':>8} {'before':>10} {'after':>10}"
+          f" {'ratio':>6}")
+    for r in new["records"]:
+        if key(r) not in before: continue
+        a, b = before[key(r)]["seconds"], r["seconds"]
+        ratio = b / a if a > 0 else math.inf
+        flag = " !" if ratio > threshold else ""
+        print(f"{r['op']:<9} {r['shape']:<7} {r['n']:>8}"
+              f" {a * 1e3:>8.2f}ms {b * 1e3:>8.2f}ms {ratio:>6.2f}{flag}")
+        if ratio > threshold: regressions.append(key(r))
+    return regressions
+
+BENCHMARKS = {
+    "memory":     memory,
+    "predicates": predicates,
+    "robust":     robust,
+    "generators": generators,
+    "history":    history,
+    "chains":     chains,
+    "split":      split,
+    "window":     window,
+    "checkpoints": checkpoints,
+    "timeline":   timeline,
+    "engines":    engines,
+    "io":         io,
+}
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description = "Melkman benchmarks.")
+    commands = parser.add_subparsers(dest = "command")
+    for name in BENCHMARKS: commands.add_parser(name)
+    run = commands.add_parser("suite",
+        help = "time every operation on every shape")
+    run.add_argument("--max-n", type = int, default = 10**5)
+    run.add_argument("--repeat", type = int, default = 3)
+    run.add_argument("--op", action = "append", choices = list(OPERATIONS))
+    run.add_argument("--shape", action = "append", choices = list(SHAPES))
+    run.add_argument("--out", help = "write the results as JSON")
+    cmp = commands.add_parser("compare", help = "compare two suite results")
+    cmp.add_argument("old")
+    cmp.add_argument("new")
+    cmp.add_argument("--threshold", type = float, default = 1.2)
+    args = parser.parse_args()
+
+    if args.command == "suite":
+        records = suite(args.max_n, args.repeat, args.op, args.shape)
+        issues = scaling(records)
+        for issue in issues: print(f"scaling: {issue}", file = sys.stderr)
+        if args.out:
+            with open(args.out, "w") as f: json.dump({
+                "python":  sys.version.split()[0],
+                "records": records,
+            }, f, indent = 1)
+        sys.exit(1 if issues else 0)
+    elif args.command == "compare":
+        with open(args.old) as f: old = json.load(f)
+        with open(args.new) as f: new = json.load(f)
+        sys.exit(1 if compare(old, new, args.threshold) else 0)
+    else:
+        for name in [args.command] if args.command else BENCHMARKS:
+            print(f"# {name}")
+            BENCHMARKS[name]()
@@ -0,0 +1,145 @@
+import os
+import mmap
+import struct
+from array import array
+from vector import V2
+from points import PointArray
+
+# Binary chain format (little-endian):
+#   header: magic b"SPC1", version (u16), flags (u16), n (u64) = 16 bytes
+#   xs:     n coordinates
+#   ys:     n coordinates
+#   index:  n int64, only if flags & INDEX
+# Coordinates are float64, or int64 if flags & INTEGER. Every column is
+# contiguous and 8-byte aligned, so a file can be mapped in memory and used
+# as a `PointArray` (or NumPy arrays) without copying.
+MAGIC   = b"SPC1"
+VERSION = 1
+HEADER  = struct.Struct("<4sHHQ")
+INDEX   = 1
+INTEGER = 2
+
+def typecode(flags): return "q" if flags & INTEGER else "d"
+
+def integral(spc): return all(
+    isinstance(p.x, int) and isinstance(p.y, int) for p in spc
+)
+
+# Write `spc` (list of `V2` or `PointArray`) to `path` in the binary format.
+# Integer coordinates are stored as int64, anything else as float64. The
+# index column is only written if some point is not at its own position.
+def save(path, spc):
+    if isinstance(spc, PointArray):
+        xs, ys, index = spc.xs, spc.ys, spc.index
+        # `array` columns have a typecode, mapped ones (`memoryview`) a
+        # format; other columns are tested value by value.
+        code = getattr(xs, "typecode", None) or getattr(xs, "format", None)
+        integer = (code == "q") if code is not None else all(
+            isinstance(v, int) for column in (xs, ys) for v in column
+        )
+        flags = (INTEGER if integer else 0) | (
+            INDEX if index is not None else 0
+        )
+    else:
+        flags = (INTEGER if integral(spc) else 0) | (
+            INDEX if any(p.index != i for i, p in enumerate(spc)) else 0
+        )
+        xs = [p.x for p in spc]
+        ys = [p.y for p in spc]
+        index = [p.index for p in spc]
+
+    code = typecode(flags)
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, flags, len(spc)))
+        array(code, xs).tofile(f)
+        array(code, ys).tofile(f)
+        if flags & INDEX: array("q", index).tofile(f)
+
+# Flags and number of points of a chain file of `size` bytes starting with
+# `buffer`, checking that the file holds every column.
+def header(buffer, size):
+    if size < HEADER.size: raise ValueError("truncated chain file")
+    magic, version, flags, n = HEADER.unpack_from(buffer)
+    if magic != MAGIC: raise ValueError("not a binary chain file")
+    if version != VERSION: raise ValueError(
+        f"unsupported chain file version {version}"
+    )
+    expected = HEADER.size + 8 * n * (2 + bool(flags & INDEX))
+    if size < expected: raise ValueError(
+        f"truncated chain file: {size} bytes for {n} points,"
+        f" expected {expected}"
+    )
+    return flags, n
+
+def is_binary(path):
+    with open(path, "rb") as f: return f.read(len(MAGIC)) == MAGIC
+
+# Map `path` in memory and return it as a read-only `PointArray` whose
+# columns are views on the mapping: nothing is copied or parsed.
+# Complexity: O(1)
+def load(path):
+    with open(path, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access = mmap.ACCESS_READ)
+    buffer = memoryview(mapped)
+    flags, n = header(buffer, len(buffer))
+    code = typecode(flags)
+
+    def column(k, code): return buffer[
+        HEADER.size + 8 * n * k : HEADER.size + 8 * n * (k + 1)
+    ].cast(code)
+
+    return PointArray(
+        column(0, code), column(1, code),
+        index = column(2, "q") if flags & INDEX else None,
+    )
+
+# Map `path` with `numpy.memmap` and return an (n, 2) view of the
+# coordinates, plus the index column (or None).
+def load_numpy(path):
+    import numpy as np
+    with open(path, "rb") as f:
+        flags, n = header(f.read(HEADER.size), os.fstat(f.fileno()).st_size)
+    dtype = np.int64 if flags & INTEGER else np.float64
+    mapped = np.memmap(path, dtype = dtype, mode = "r",
+                       offset = HEADER.size, shape = (2, n))
+    index = np.memmap(path, dtype = np.int64, mode = "r",
+                      offset = HEADER.size + 16 * n, shape = (n,)) \
+            if flags & INDEX else None
+    return mapped.T, index
+
+# Malformed line of a text chain, `line` being its number (from 1).
+class ParseError(ValueError):
+    def __init__(self, line, message):
+        ValueError.__init__(self, f"line {line}: {message}")
+        self.line = line
+        self.message = message
+
+# Parse a text chain: one point per line, "x y" or "x,y". Blank lines and
+# lines starting with '#' are ignored. Raises `ParseError` on any other line
+# which does not start with two numbers.
+def parse(lines):
+    spc = []
+    for k, line in enumerate(lines, 1):
+        line = line.strip()
+        if (not line) or line.startswith("#"): continue
+        try: x, y = map(number, line.replace(",", " ").split()[:2])
+        except ValueError: raise ParseError(
+            k, f"expected 'x y' or 'x,y', got {line!r}"
+        ) from None
+        spc.append(V2(x, y, index = len(spc)))
+    return spc
+
+def number(s):
+    try: return int(s)
+    except ValueError: return float(s)
+
+def load_text(path):
+    with open(path) as f: return parse(f)
+
+def save_text(path, spc):
+    with open(path, "w") as f:
+        for p in spc: f.write(f"{p.x} {p.y}\n")
+
+# Load `path`, whichever its format.
+def read(path):
+    return load(path) if is_binary(path) else load_text(path)
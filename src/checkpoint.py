@@ -0,0 +1,120 @@
+import struct
+import itertools
+from array import array
+from melkman import Melkman, Entry
+
+# Checkpoints of a `Melkman` run, to pause it and resume it later, possibly
+# in another process. Points are stored as their index in the chain, so a
+# checkpoint is small and the chain itself (e.g. a binary chain file mapped
+# with `chainio.load`) is given back when resuming. Points must be indexed by
+# their position in the chain, which is the case of generated and loaded
+# chains.
+#
+# Format (little-endian):
+#   header:  magic b"MKC1", version (u16), flags (u16, unused), rotation
+#            (i64), iter.i (i64), chain length (u64), history maxlen (i64,
+#            -1 for None), hull length (u64), history entries (u64)
+#   hull:    hull length int64 indices
+#   entries: index, left count, right count (int64 each) per entry
+#   popped:  all left indices then all right indices (int64), entry by entry
+MAGIC   = b"MKC1"
+VERSION = 1
+HEADER  = struct.Struct("<4sHHqqQqQQ")
+
+# Serialize the state of `melkman` with its last `history` history entries
+# (all of them if None).
+# Complexity: O(h + size of the kept history)
+def dumps(melkman, history = None):
+    entries = list(melkman.history) if history is None else \
+              list(itertools.islice(reversed(melkman.history), history))[::-1]
+    maxlen = melkman.history.maxlen
+
+    counts = array("q")
+    popped = array("q")
+    for e in entries: counts.extend((e.index, len(e.left), len(e.right)))
+    for e in entries:
+        popped.extend(p.index for p in e.left)
+        popped.extend(p.index for p in e.right)
+
+    return b"".join((
+        HEADER.pack(
+            MAGIC, VERSION, 0, melkman.rotation, melkman.iter.i,
+            len(melkman.spc), -1 if maxlen is None else maxlen,
+            len(melkman.hull), len(entries),
+        ),
+        array("q", (p.index for p in melkman.hull)).tobytes(),
+        counts.tobytes(),
+        popped.tobytes(),
+    ))
+
+# Rebuild a `Melkman` instance over `spc` from `data`, ready to process the
+# remaining points of `spc`: nothing is reprocessed. Raises `ValueError` if
+# `data` is not a complete checkpoint of a chain like `spc`.
+# Complexity: O(h + size of the kept history)
+def loads(data, spc):
+    if len(data) < HEADER.size: raise ValueError("truncated checkpoint")
+    magic, version, _, rotation, i, n, maxlen, h, m = \
+        HEADER.unpack_from(data)
+    if magic != MAGIC: raise ValueError("not a Melkman checkpoint")
+    if version != VERSION: raise ValueError(
+        f"unsupported checkpoint version {version}"
+    )
+    if len(spc) < n: raise ValueError(
+        f"checkpoint of a chain of {n} points, got {len(spc)}"
+    )
+
+    def column(start, count):
+        values = array("q")
+        values.frombytes(data[start : start + 8 * count])
+        return values
+
+    # One object per point, so that the hull's ends are the same object.
+    points = {}
+    def point(k):
+        p = points.get(k)
+        if p is None: p = points[k] = spc[k]
+        return p
+
+    start = HEADER.size
+    if len(data) < start + 8 * (h + 3 * m): raise ValueError(
+        "truncated checkpoint"
+    )
+    hull = column(start, h)
+    counts = column(start + 8 * h, 3 * m)
+    if any(c < 0 for c in counts[1::3] + counts[2::3]): raise ValueError(
+        "negative count of popped points"
+    )
+    npopped = sum(counts[1::3]) + sum(counts[2::3])
+    if len(data) != start + 8 * (h + 3 * m + npopped): raise ValueError(
+        f"checkpoint of {len(data)} bytes, expected"
+        f" {start + 8 * (h + 3 * m + npopped)}"
+    )
+    popped = column(start + 8 * (h + 3 * m), npopped)
+    if any(not 0 <= k < n for k in itertools.chain(hull, popped)):
+        raise ValueError(f"point index out of range of {n} points")
+
+    melkman = Melkman(spc, history = None if maxlen < 0 else maxlen)
+    melkman.rotation = rotation
+    melkman.iter.i = i
+    melkman.hull.extend(point(k) for k in hull)
+
+    k = 0
+    for j in range(m):
+        entry = Entry(counts[3 * j])
+        nleft, nright = counts[3 * j + 1], counts[3 * j + 2]
+        entry.left  = tuple(point(q) for q in popped[k : k + nleft])
+        entry.right = tuple(point(q) for q in popped[k + nleft :
+                                                     k + nleft + nright])
+        k += nleft + nright
+        melkman.history.append(entry)
+    # The current entry is still being filled.
+    if melkman.history:
+        entry = melkman.history[-1]
+        entry.left, entry.right = list(entry.left), list(entry.right)
+    return melkman
+
+def save(path, melkman, history = None):
+    with open(path, "wb") as f: f.write(dumps(melkman, history))
+
+def load(path, spc):
+    with open(path, "rb") as f: return loads(f.read(), spc)
@@ -0,0 +1,122 @@
+import os
+import sys
+import time
+import argparse
+import chainio
+import engine
+from utils import Table
+from points import PointArray
+from melkman import Melkman
+
+# Headless entry point: compute the convex hull of chains read from files,
+# directories or stdin, without Tk. Chains are text or binary files (see
+# `chainio`). Each output line holds the hull of one chain as point indices,
+# in the order of `Melkman.hull`.
+#
+#   python src/cli.py chain.txt
+#   python src/cli.py chains/ --workers 4 --time
+#   cat chain.txt | python src/cli.py
+
+def load(path):
+    if path == "-": return chainio.parse(sys.stdin)
+    return chainio.read(path)
+
+# Files to process: `paths` themselves, or the files they contain for
+# directories (sorted, not recursive).
+def expand(paths):
+    for path in paths:
+        if os.path.isdir(path):
+            for name in sorted(os.listdir(path)):
+                full = os.path.join(path, name)
+                if os.path.isfile(full): yield full
+        else: yield path
+
+# Load the chain from `path`, run the algorithm on it and return the hull
+# indices with the load and run durations. Without `check`, the index-based
+# engines are used (the integer one for integer coordinates). A chain which
+# cannot be read gives an `error` message instead, so that one bad file does
+# not stop the others.
+def hull(path, check = False):
+    t0 = time.perf_counter()
+    try: spc = load(path)
+    except chainio.ParseError as e:
+        return Table(path = path, error = f"{path}:{e.line}: {e.message}")
+    except (OSError, ValueError) as e:
+        return Table(path = path, error = f"{path}: {e}")
+    t1 = time.perf_counter()
+    valid = None
+    if check:
+        melkman = Melkman(spc, history = 0)
+        melkman.run()
+        t2 = time.perf_counter()
+        import validate
+        valid = validate.check(melkman).valid
+        indices = [p.index for p in melkman.hull]
+    else:
+        positions, _ = engine.hull(spc)
+        t2 = time.perf_counter()
+        index = spc.indices() if isinstance(spc, PointArray) \
+                else [p.index for p in spc]
+        indices = [index[i] for i in positions]
+    return Table(
+        path = path, error = None, indices = indices, n = len(spc),
+        load = t1 - t0, run = t2 - t1, valid = valid,
+    )
+
+def main(argv = None):
+    parser = argparse.ArgumentParser(
+        description = "Convex hulls of simple polygonal chains."
+    )
+    parser.add_argument("paths", nargs = "*", default = ["-"],
+        help = "chain files or directories of chain files ('-': stdin)")
+    parser.add_argument("--workers", type = int, default = 1,
+        help = "number of worker processes")
+    parser.add_argument("--time", action = "store_true",
+        help = "report timings on stderr")
+    parser.add_argument("--check", action = "store_true",
+        help = "validate each hull")
+    args = parser.parse_args(argv)
+
+    paths = list(expand(args.paths))
+    start = time.perf_counter()
+    if (args.workers > 1) and ("-" not in paths):
+        import concurrent.futures
+        executor = concurrent.futures.ProcessPoolExecutor(args.workers)
+        results = executor.map(hull, paths, [args.check] * len(paths))
+    else:
+        executor = None
+        results = (hull(path, args.check) for path in paths)
+
+    failed = 0
+    chains = 0
+    total = 0
+    for r in results:
+        if r.error is not None:
+            failed += 1
+            print(r.error, file = sys.stderr)
+            continue
+        chains += 1
+        prefix = f"{r.path}: " if len(paths) > 1 else ""
+        print(prefix + " ".join(map(str, r.indices)))
+        total += r.n
+        if r.valid is False:
+            failed += 1
+            print(f"{r.path}: invalid hull", file = sys.stderr)
+        if args.time: print(
+            f"{r.path}: n {r.n}, h {len(r.indices)},"
+            f" load {r.load * 1e3:.2f}ms, run {r.run * 1e3:.2f}ms",
+            file = sys.stderr,
+        )
+    if executor is not None: executor.shutdown()
+
+    if args.time:
+        elapsed = time.perf_counter() - start
+        print(
+            f"total: {chains} chains, {total} points"
+            f" in {elapsed * 1e3:.2f}ms",
+            file = sys.stderr,
+        )
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,80 @@
+import heapq
+import kernel
+
+# Operations on convex hulls as produced by `Melkman`: deques of points whose
+# first and last elements are the same point.
+
+def rot(a, b, c): return kernel.rotation(a.x, a.y, b.x, b.y, c.x, c.y)
+
+def key(p): return (p.x, p.y)
+
+# Vertices of `hull`, without the repeated closing point.
+def vertices(hull):
+    vs = list(hull)
+    if (len(vs) >= 2) and (vs[0] is vs[-1]): vs.pop()
+    return vs
+
+# Split the convex polygon `vs` at its lowest and highest vertices (in (x, y)
+# order) into two paths going from the lowest to the highest one. Both paths
+# are sorted in (x, y) order.
+# Complexity: O(h)
+def paths(vs):
+    m = len(vs)
+    if m < 4: return [sorted(vs, key = key)]
+    lo = min(range(m), key = lambda i: key(vs[i]))
+    hi = max(range(m), key = lambda i: key(vs[i]))
+    forward  = [vs[(lo + k) % m] for k in range((hi - lo) % m + 1)]
+    backward = [vs[(lo - k) % m] for k in range((lo - hi) % m + 1)]
+    return [forward, backward]
+
+# Convex hull of the union of two convex hulls, as a cycle of vertices
+# without repetition nor collinear vertices.
+# The sorted paths of both hulls are merged, then Andrew's monotone chain
+# builds the lower and upper hulls.
+# Complexity: O(h1 + h2)
+def union(h1, h2):
+    points = list(heapq.merge(
+        *paths(vertices(h1)), *paths(vertices(h2)), key = key
+    ))
+    if len(points) <= 2: return [
+        p for i, p in enumerate(points)
+        if (i == 0) or (key(p) != key(points[i - 1]))
+    ]
+
+    def half(points):
+        chain = []
+        for p in points:
+            while (len(chain) >= 2) and (rot(chain[-2], chain[-1], p) >= 0):
+                chain.pop()
+            chain.append(p)
+        return chain
+
+    lower = half(points)
+    upper = half(reversed(points))
+    return lower[:-1] + upper[:-1]
+
+# Bridges between `h1` and `h2`: the edges of their union's hull joining a
+# vertex of `h1` to a vertex of `h2`, as (a, b) pairs with `a` from `h1`. For
+# two separated hulls these are the upper and lower tangents.
+# Complexity: O(h1 + h2)
+def bridges(h1, h2, cycle = None):
+    if cycle is None: cycle = union(h1, h2)
+    first = {id(p) for p in h1}
+    tangents = []
+    for i, a in enumerate(cycle):
+        b = cycle[(i + 1) % len(cycle)]
+        if (id(a) in first) and (id(b) not in first): tangents.append((a, b))
+        elif (id(b) in first) and (id(a) not in first):
+            tangents.append((b, a))
+    return tangents
+
+# Arrange `cycle` like a `Melkman.hull` deque: turning with sign `rotation`,
+# starting (and ending) at the vertex with the highest index, which is the
+# last point `Melkman` would have pushed.
+def arrange(cycle, rotation):
+    if not cycle: return []
+    if (len(cycle) >= 3) and (rot(*cycle[:3]) != rotation):
+        cycle = cycle[::-1]
+    start = max(range(len(cycle)), key = lambda i: cycle[i].index)
+    cycle = cycle[start:] + cycle[:start]
+    return cycle + [cycle[0]]
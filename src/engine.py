@@ -0,0 +1,118 @@
+import collections
+import kernel
+from points import PointArray
+
+# Index-based Melkman engines, without `V2` objects nor history, shared by
+# `batch`, `parallel` and the command line. The chain is given as two flat
+# lists of coordinates: scalar indexing into lists is cheaper than into
+# packed arrays, so packed columns are unpacked once with `tolist`.
+
+# Coordinates of `spc` (a `PointArray` or a list of `V2`) as two lists.
+def columns(spc):
+    if isinstance(spc, PointArray): return spc.xs.tolist(), spc.ys.tolist()
+    return [p.x for p in spc], [p.y for p in spc]
+
+# Whether every coordinate is a Python integer (e.g. pixel coordinates, or a
+# chain stored as int64).
+# Complexity: O(n)
+def integral(xs, ys): return all(x.__class__ is int for x in xs) \
+                         and all(y.__class__ is int for y in ys)
+
+# `kernel.rotation(a, b, c)` on indices into `xs` and `ys`, inlined.
+def rotations(xs, ys):
+    bound = kernel.BOUND
+    def rot(a, b, c):
+        ax = xs[a] ; ay = ys[a]
+        l = (xs[b] - ax) * (ys[c] - ay)
+        r = (ys[b] - ay) * (xs[c] - ax)
+        d = l - r
+        if d.__class__ is not int:
+            e = bound * (abs(l) + abs(r))
+            if -e <= d <= e: return kernel.exact(
+                ax, ay, xs[b], ys[b], ax, ay, xs[c], ys[c]
+            )
+        return 1 if d > 0 else -1 if d < 0 else 0
+    return rot
+
+# Initialization, see `Melkman.init`: clear `dq` and process points from
+# `first` until the hull is initialized. Returns the index of the next point
+# and the rotation.
+def init(first, last, dq, rot):
+    dq.clear()
+    rotation = 0
+    i = first
+    while i < last:
+        if len(dq) >= 4 and rotation != 0: break
+        rotation = rot(dq[1], dq[-1], i) if len(dq) >= 2 else 0
+        if len(dq) >= 3 and rotation == 0: dq.pop()
+        if dq: dq.popleft()
+        dq.appendleft(i)
+        dq.append(i)
+        i += 1
+    return i, rotation
+
+# Run the Melkman algorithm over the chain `xs[first:last]`, `ys[first:last]`.
+# The deque `dq` is cleared and filled with the hull as indices into `xs` and
+# `ys`; the rotation is returned. The deque holds indices instead of `V2`
+# objects, but the control flow is the same as `Melkman.init` and
+# `Melkman.step`. Any numbers are accepted, see `integer` for integers only.
+# Complexity: O(last - first)
+def melkman(xs, ys, first, last, dq):
+    rot = rotations(xs, ys)
+    i, rotation = init(first, last, dq, rot)
+
+    # Main loop, see `Melkman.step`.
+    for i in range(i, last):
+        if rot(dq[0], dq[1], i) == rotation \
+        and rot(dq[-2], dq[-1], i) == rotation: continue
+        while rot(dq[0], dq[1], i) != rotation: dq.popleft()
+        while rot(dq[-2], dq[-1], i) != rotation: dq.pop()
+        dq.appendleft(i)
+        dq.append(i)
+
+    return rotation
+
+# Same as `melkman` for integer coordinates only. In the main loop, the
+# orientation tests are exact integer arithmetic written out in place: no
+# call, no floating-point filter, no division. Once initialized, `rotation`
+# is -1 or 1, and `rot(a, b, i) == rotation` is `d * rotation > 0` for the
+# determinant `d`.
+# Complexity: O(last - first)
+def integer(xs, ys, first, last, dq):
+    i, rotation = init(first, last, dq, rotations(xs, ys))
+
+    for i in range(i, last):
+        x = xs[i] ; y = ys[i]
+        a = dq[0] ; b = dq[1] ; ax = xs[a] ; ay = ys[a]
+        if ((xs[b] - ax) * (y - ay) - (ys[b] - ay) * (x - ax)) \
+           * rotation > 0:
+            a = dq[-2] ; b = dq[-1] ; ax = xs[a] ; ay = ys[a]
+            if ((xs[b] - ax) * (y - ay) - (ys[b] - ay) * (x - ax)) \
+               * rotation > 0: continue
+        while True:
+            a = dq[0] ; b = dq[1] ; ax = xs[a] ; ay = ys[a]
+            if ((xs[b] - ax) * (y - ay) - (ys[b] - ay) * (x - ax)) \
+               * rotation > 0: break
+            dq.popleft()
+        while True:
+            a = dq[-2] ; b = dq[-1] ; ax = xs[a] ; ay = ys[a]
+            if ((xs[b] - ax) * (y - ay) - (ys[b] - ay) * (x - ax)) \
+               * rotation > 0: break
+            dq.pop()
+        dq.appendleft(i)
+        dq.append(i)
+
+    return rotation
+
+# Engine for the chain `xs`, `ys`: `integer` if its coordinates are
+# integers, `melkman` otherwise.
+def select(xs, ys): return integer if integral(xs, ys) else melkman
+
+# Hull of `spc` (a `PointArray` or a list of `V2`) as positions in `spc`, in
+# the order of `Melkman.hull`, and its rotation.
+# Complexity: O(n)
+def hull(spc):
+    xs, ys = columns(spc)
+    dq = collections.deque()
+    rotation = select(xs, ys)(xs, ys, 0, len(xs), dq)
+    return list(dq), rotation
@@ -0,0 +1,70 @@
+import collections
+
+# Uniform grid indexing the segments of a simple polygonal chain by their
+# bounding boxes. Segment `i` is [spc[i], spc[i + 1]].
+# The grid is incremental: `update` only indexes the segments appended to the
+# chain since the previous call, so it can live alongside a growing chain.
+# A segment covering more than `CELLS` cells is not added cell by cell but
+# to an overflow list which every query scans, so long segments cost O(1)
+# memory. Once the overflow list holds too many segments, cells are too small
+# for the chain: the grid is rebuilt with cells `GROWTH` times larger.
+class SegmentGrid:
+    CELLS  = 16
+    GROWTH = 4
+
+    def __init__(self, size = 32):
+        self.size = size
+        self.cells = collections.defaultdict(list)
+        self.overflow = []
+        self.n = 0
+
+    # Range of cells covered by the bounding box of [AB].
+    def bounds(self, a, b):
+        s = self.size
+        x0, x1 = sorted((int(a.x // s), int(b.x // s)))
+        y0, y1 = sorted((int(a.y // s), int(b.y // s)))
+        return x0, x1, y0, y1
+
+    # Cells covered by the bounding box of [AB].
+    def cover(self, a, b):
+        x0, x1, y0, y1 = self.bounds(a, b)
+        for x in range(x0, x1 + 1):
+            for y in range(y0, y1 + 1): yield (x, y)
+
+    def count(self, a, b):
+        x0, x1, y0, y1 = self.bounds(a, b)
+        return (x1 - x0 + 1) * (y1 - y0 + 1)
+
+    def insert(self, spc, i):
+        a, b = spc[i], spc[i + 1]
+        if self.count(a, b) > self.CELLS: return self.overflow.append(i)
+        for cell in self.cover(a, b): self.cells[cell].append(i)
+
+    # Index the segments of `spc` which are not indexed yet.
+    # Complexity: O(k) amortized for k new segments
+    def update(self, spc):
+        for i in range(self.n, len(spc) - 1): self.insert(spc, i)
+        self.n = max(self.n, len(spc) - 1)
+        if len(self.overflow) > self.CELLS + self.n // 8: self.rebuild(spc)
+
+    # Index every segment again with larger cells, until the overflow list
+    # is short enough.
+    def rebuild(self, spc):
+        while len(self.overflow) > self.CELLS + self.n // 8:
+            self.size *= self.GROWTH
+            self.cells.clear()
+            self.overflow = []
+            for i in range(self.n): self.insert(spc, i)
+
+    # Indices of the segments whose cells overlap the bounding box of [AB],
+    # plus the overflowing ones, in ascending order. When the box covers more
+    # cells than there are segments, every segment is returned: scanning them
+    # is cheaper.
+    def query(self, a, b):
+        if self.count(a, b) > self.n: return range(self.n)
+        found = set(self.overflow)
+        for cell in self.cover(a, b):
+            found.update(self.cells.get(cell, ()))
+        return sorted(found)
+
+    def __len__(self): return self.n
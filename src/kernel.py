@@ -0,0 +1,99 @@
+from fractions import Fraction
+
+# Orientation and intersection predicates on raw coordinates.
+# These are the allocation-free counterparts of `V2.rotation`,
+# `V2.position` and `V2.intersection`, meant for inner loops: no temporary
+# `V2` is built and no classmethod is dispatched.
+#
+# Predicates are exact. Integer coordinates are exact by nature (Python
+# integers). With floats, the sign is computed in floating point and only
+# trusted if the result is larger than an error bound (filter). Otherwise it
+# is recomputed exactly with `Fraction`, which only happens for (nearly)
+# degenerate inputs.
+
+# Relative error bound of `l - r` or `l + r` where `l` and `r` are products of
+# two rounded differences (Shewchuk's ccwerrboundA).
+EPSILON = 2.0 ** -53
+BOUND = (3.0 + 16.0 * EPSILON) * EPSILON
+
+# Sign of cross(b - a, d - c) (or dot(b - a, d - c) if `dot`), computed
+# exactly. Floats convert to `Fraction` without rounding, or to `int` when
+# they are integral (e.g. lattice points stored as float64), which is much
+# cheaper.
+def exact(ax, ay, bx, by, cx, cy, dx, dy, dot = False):
+    values = (ax, ay, bx, by, cx, cy, dx, dy)
+    integral = all((v.__class__ is int) or v.is_integer() for v in values)
+    ax, ay, bx, by, cx, cy, dx, dy = map(
+        int if integral else Fraction, values
+    )
+    d = (bx - ax) * (dx - cx) + (by - ay) * (dy - cy) if dot \
+   else (bx - ax) * (dy - cy) - (by - ay) * (dx - cx)
+    return 1 if d > 0 else -1 if d < 0 else 0
+
+# Sign of cross(b - a, d - c).
+def cross(ax, ay, bx, by, cx, cy, dx, dy):
+    l = (bx - ax) * (dy - cy)
+    r = (by - ay) * (dx - cx)
+    d = l - r
+    if d.__class__ is not int:
+        bound = BOUND * (abs(l) + abs(r))
+        if -bound <= d <= bound:
+            return exact(ax, ay, bx, by, cx, cy, dx, dy)
+    return 1 if d > 0 else -1 if d < 0 else 0
+
+# Sign of dot(b - a, d - c).
+def dot(ax, ay, bx, by, cx, cy, dx, dy):
+    l = (bx - ax) * (dx - cx)
+    r = (by - ay) * (dy - cy)
+    d = l + r
+    if d.__class__ is not int:
+        bound = BOUND * (abs(l) + abs(r))
+        if -bound <= d <= bound:
+            return exact(ax, ay, bx, by, cx, cy, dx, dy, dot = True)
+    return 1 if d > 0 else -1 if d < 0 else 0
+
+# Same convention as `V2.rotation`, in a left-handed 2D coordinate system:
+# Returns -1 if `c` is on the left of `ab` -> CCW.
+# Returns  0 if `a`, `b` and `c` are collinear.
+# Returns  1 if `c` is on the right of `ab` -> CW.
+# `cross(a, b, a, c)`, inlined: this is the hottest predicate.
+def rotation(ax, ay, bx, by, cx, cy):
+    l = (bx - ax) * (cy - ay)
+    r = (by - ay) * (cx - ax)
+    d = l - r
+    if d.__class__ is not int:
+        bound = BOUND * (abs(l) + abs(r))
+        if -bound <= d <= bound:
+            return exact(ax, ay, bx, by, ax, ay, cx, cy)
+    return 1 if d > 0 else -1 if d < 0 else 0
+
+# Same convention as `V2.position`:
+# Returns -1 if `c` is behind `ab`, 0 if `c` is inside `ab`, 1 if `c` is in
+# front of `ab`.
+def position(ax, ay, bx, by, cx, cy):
+    if dot(cx, cy, ax, ay, cx, cy, bx, by) <= 0: return 0
+    if dot(ax, ay, bx, by, ax, ay, cx, cy) < 0: return -1
+    return 1
+
+# Same semantics as `V2.intersection` for segments [AB] and [CD]. `adjacent`
+# states that `b` and `c` are the same vertex of the chain, which is what
+# `V2.intersection` detects with `b == c`.
+# Division-free: when the segments are not parallel, they intersect iff each
+# one has its endpoints on both sides of (or on) the other's line.
+def intersection(ax, ay, bx, by, cx, cy, dx, dy, adjacent = False):
+    parallel = cross(cx, cy, dx, dy, ax, ay, bx, by) == 0
+
+    if adjacent: return parallel \
+                    and (position(ax, ay, bx, by, dx, dy) <= 0)
+
+    if parallel:
+        if rotation(cx, cy, dx, dy, ax, ay) != 0: return False
+        return (position(ax, ay, bx, by, cx, cy) == 0) \
+            or (position(ax, ay, bx, by, dx, dy) == 0) \
+            or (position(cx, cy, dx, dy, ax, ay) == 0) \
+            or (position(cx, cy, dx, dy, bx, by) == 0)
+
+    return (rotation(cx, cy, dx, dy, ax, ay)
+          * rotation(cx, cy, dx, dy, bx, by) <= 0) \
+       and (rotation(ax, ay, bx, by, cx, cy)
+          * rotation(ax, ay, bx, by, dx, dy) <= 0)
@@ -1,38 +1,82 @@
+import sys
 import collections
 import itertools
-from utils import Table, Iter
+import kernel
+import convex
+import engine
+import tracing
+from utils import Iter, Cursor
 from vector import V2
 from spc import SimplePolygonalChain as SPC
+from grid import SegmentGrid
 
+# History entry: the points popped from the left and from the right of the
+# deque while processing the point following `index`. Popped points are
+# gathered in lists while the entry is the current one, then frozen into
+# tuples (the empty tuple is shared) when the next entry starts.
+class Entry:
+    __slots__ = ("index", "left", "right")
+
+    def __init__(self, index):
+        self.index = index
+        self.left  = ()
+        self.right = ()
+
+    def freeze(self):
+        self.left  = tuple(self.left)
+        self.right = tuple(self.right)
+
+# Retention policy, given by `maxlen`:
+# * None: every entry is kept.
+# * K > 0: only the last K entries are kept, `rewind` can undo K steps.
+# * 0: disabled, entries are neither created nor filled.
 class History(collections.deque):
-    def __init__(self): collections.deque.__init__(self)
+    def __init__(self, maxlen = None):
+        collections.deque.__init__(self, maxlen = maxlen)
 
     # Add a new history entry.
-    def new(self, index): self.append(Table(
-        index = index - 1,
-        left  = [],
-        right = [],
-    ))
+    def new(self, index):
+        if self.maxlen == 0: return
+        if self: self[-1].freeze()
+        self.append(Entry(index - 1))
 
     # Add a point `p` to the current entry. `p` has been popped from the left
     # of a deque.
-    def insert_left(self, p): self[-1].left.append(p)
+    def insert_left(self, p):
+        if not self: return
+        entry = self[-1]
+        if not entry.left: entry.left = []
+        entry.left.append(p)
 
     # Add a point `p` to the current entry. `p` has been popped from the right
     # of a deque.
-    def insert_right(self, p): self[-1].right.append(p)
+    def insert_right(self, p):
+        if not self: return
+        entry = self[-1]
+        if not entry.right: entry.right = []
+        entry.right.append(p)
 
     def rewind(self): return self.pop() if self else None
 
-class Melkman:
-    # Initialize the algorithm with a simple polygonal chain `spc`. If `spc`
-    # is empty, points can be added later.
-    def __init__(self, spc):
-        self.spc = spc
-        self.iter = Iter(self.spc)
+    # Memory used by the history itself, in bytes. The points are not
+    # counted: they belong to the chain.
+    def nbytes(self): return sys.getsizeof(self) + sum(
+        sys.getsizeof(e) + sys.getsizeof(e.left) + sys.getsizeof(e.right)
+        for e in self
+    )
+
+# State and steps of the Melkman algorithm shared by `Melkman` (over a
+# chain) and `Stream` (over a stream of points): the deque `self.hull`, its
+# rotation, the history and `self.iter`, which tracks the index of the
+# current point (`Iter` or `Cursor`). Subclasses feed the points to `init`
+# and `step`.
+class Hull:
+    # `history` is the retention policy of `self.history`, see `History`.
+    def __init__(self, iter, history = None):
+        self.iter = iter
         self.hull = collections.deque()
         self.rotation = 0
-        self.history = History()
+        self.history = History(maxlen = history)
 
     @property
     def initialized(self): return (len(self.hull) >= 4) \
@@ -60,12 +104,13 @@ class Melkman:
     # Deleted points are saved in `self.history`.
     # Complexity: O(1)
     def step(self, p):
-        def rotstart(): return V2.rotation(
-            self.hull[0], self.hull[1], p
-        ) == self.rotation
-        def rotend(): return V2.rotation(
-            self.hull[-2], self.hull[-1], p
-        ) == self.rotation
+        hull, rotation, x, y = self.hull, self.rotation, p.x, p.y
+        def rotstart():
+            a, b = hull[0], hull[1]
+            return kernel.rotation(a.x, a.y, b.x, b.y, x, y) == rotation
+        def rotend():
+            a, b = hull[-2], hull[-1]
+            return kernel.rotation(a.x, a.y, b.x, b.y, x, y) == rotation
 
         if rotstart() and rotend(): return
         self.history.new(index = self.iter.i)
@@ -79,11 +124,61 @@ class Melkman:
         self.hull.appendleft(p)
         self.hull.append(p)
 
+    def rewind(self):
+        actions = self.history.rewind()
+        if not actions: return
+
+        self.iter.i = actions.index
+        self.hull.pop()
+        self.hull.popleft()
+        for p in actions.left[::-1]:  self.hull.appendleft(p)
+        for p in actions.right[::-1]: self.hull.append(p)
+
+    # Return the tangents necessary to merge the current convex hull and
+    # `other.hull`: the upper and lower tangents when both hulls are
+    # separated, or every bridge of their union's hull when they overlap.
+    # Complexity: O(h1 + h2)
+    def bridge(self, other): return convex.bridges(self.hull, other.hull)
+
+    # Attach `observer` (see `observe.Observer`), which then receives the
+    # diff of each step, and return it. Same as `tracing.attach`.
+    def observe(self, observer): return tracing.attach(self, observer)
+
+    def __repr__(self): return ", ".join(
+        str(p.index) for p in self.hull
+    ) if self.hull else "∅"
+
+class Melkman(Hull):
+    # Initialize the algorithm with a simple polygonal chain `spc`. If `spc`
+    # is empty, points can be added later.
+    # `history` is the retention policy of `self.history`, see `History`.
+    def __init__(self, spc, history = None):
+        Hull.__init__(self, Iter(spc), history)
+        self.spc = spc
+        self.grid = None
+
     # Process all points from `self.spc`.
+    # Without history, a run from the first point goes through the
+    # index-based engines, which give the same hull and rotation (see
+    # `engine`; the integer one for integer coordinates). Subclasses which
+    # override `init` or `step`, like traced instances, process the points
+    # one by one.
     # Complexity: O(n)
     def run(self):
+        if (self.history.maxlen == 0) and (self.iter.i == -1) \
+        and (type(self).init is Hull.init) and (type(self).step is Hull.step):
+            return self.run_engine()
         while not self.iter.finished: self.next()
 
+    # Run the index-based engine over `self.spc` and fill `self.hull` with
+    # its points, the same object at both ends.
+    # Complexity: O(n)
+    def run_engine(self):
+        positions, self.rotation = engine.hull(self.spc)
+        points = {i: self.spc[i] for i in set(positions)}
+        self.hull.extend(points[i] for i in positions)
+        self.iter.i = len(self.spc) - 1
+
     # Process the next point from `self.spc`.
     # Then, execute one step of the Melkman algorithm to decide whether to add
     # this point to `self.hull` or not.
@@ -99,26 +194,18 @@ class Melkman:
     # simple polygonal chain property.
     # Then, execute one step of the Melkman algorithm to decide whether to add
     # this point to `self.hull` or not.
-    # Complexity: O(n)
+    # `self.grid` indexes the segments of `self.spc` to speed up the check.
+    # Complexity: O(n) worst case
     def add(self, p):
         p = V2(p, index = len(self.spc))
-        if not SPC.check_1(self.spc, p): return
+        if self.grid is None: self.grid = SegmentGrid()
+        if not SPC.check_1(self.spc, p, self.grid): return
         self.spc.append(p)
         self.iter.next()
 
         if not self.initialized: return self.init(p)
         else: self.step(p)
 
-    def rewind(self):
-        actions = self.history.rewind()
-        if not actions: return
-
-        self.iter.i = actions.index
-        self.hull.pop()
-        self.hull.popleft()
-        for p in actions.left[::-1]:  self.hull.appendleft(p)
-        for p in actions.right[::-1]: self.hull.append(p)
-
     # Split the current hull into 2 new hulls.
     # * m1.hull is empty and awaits for new points to be processed.
     # * m2.hull is equivalent to the current hull with `spc`'s points added in
@@ -130,22 +217,25 @@ class Melkman:
         m2.run()
         return m1, m2
 
-    # Return the two tangents necessary to merge the current convex hull and
-    # `other.hull`.
-    def bridge(self, other):
-        h1, h2 = self.hull, other.hull
-        def is_tangent(a, b):
-            side = 0
-            for p in itertools.chain(h1, h2):
-                rot_abp = V2.rotation(a, b, p)
-                if side == 0: side = rot_abp
-                elif (rot_abp != side) and (rot_abp != 0): return False
-            return True
-
-        tangents = []
-        for a, b in itertools.product(h1, h2):
-            if is_tangent(a, b): tangents.append((a, b))
-        return tangents
+    # Merge the current result and `other`'s into a new instance, as if the
+    # algorithm had processed `self.spc` followed by `other.spc`. Only the
+    # two hulls are used: no point is processed again, unless the current
+    # hull is not initialized yet (its rotation is not known), in which case
+    # `other.spc` is processed from the current state.
+    # Complexity: O(h1 + h2) + copying both chains
+    def merge(self, other):
+        merged = self.__class__(list(itertools.chain(self.spc, other.spc)))
+        merged.rotation = self.rotation
+        if not self.initialized:
+            merged.hull.extend(self.hull)
+            merged.iter.i = self.iter.i
+            merged.run()
+            return merged
+
+        cycle = convex.union(self.hull, other.hull)
+        merged.hull.extend(convex.arrange(cycle, merged.rotation))
+        merged.iter.i = len(merged.spc) - 1
+        return merged
 
     # Once the algorithm has processed the whole `self.spc`, this method can
     # check the validity of the convex hull.
@@ -162,6 +252,97 @@ class Melkman:
                 if (r != self.rotation) and (r != 0): return False
         return True
 
+# Melkman algorithm over an unbounded stream of points, e.g. a trajectory
+# read from a GPS trace or a file. The chain is not kept: memory is
+# proportional to the hull, plus the history if enabled (`history` is its
+# retention policy, see `History`; `rewind` needs it). Points are assumed to
+# form a simple polygonal chain, which cannot be checked without the whole
+# chain.
+class Stream(Hull):
+    def __init__(self, history = 0): Hull.__init__(self, Cursor(), history)
+
+    # Number of points received.
+    def __len__(self): return self.iter.i + 1
+
+    # Process the next point `p` of the stream and return the current hull.
+    # `p` is a `V2` or a pair of coordinates, indexed by its position in the
+    # stream.
+    # Complexity: O(1) amortized
+    def push(self, p):
+        if not isinstance(p, V2): p = V2(p, index = self.iter.i + 1)
+        self.iter.next()
+        if not self.initialized: self.init(p)
+        else: self.step(p)
+        return self.hull
+
+    # Process every point of the iterable `points`, yielding the current hull
+    # after each one.
+    def consume(self, points):
+        for p in points: yield self.push(p)
+
+    # Same as `consume`, for an async iterable.
+    async def aconsume(self, points):
+        async for p in points: yield self.push(p)
+
+# Convex hull of the last points of a stream, with O(1) amortized insertion
+# at the back and deletion at the front.
+# Like `split`, the window is kept as two hulls:
+# * `back` processes the newest points, in order (`Stream`, no history).
+# * `front` has processed the oldest points in reverse order, with history:
+# removing the oldest point undoes its step with `rewind`.
+# When `front` runs out of points, the points of `back` are moved to a new
+# `front`, each point being processed there once. The current hull is the
+# union of both hulls.
+# If `size` is not None, pushing a point beyond `size` points removes the
+# oldest one.
+class SlidingWindow:
+    def __init__(self, size = None):
+        self.size = size
+        self.front = Melkman([])
+        self.back = Stream()
+        self.pending = collections.deque()
+        self.count = 0
+
+    # Number of points in the window.
+    def __len__(self): return self.front.iter.i + 1 + len(self.pending)
+
+    # Add `p` at the back of the window. `p` is a `V2` or a pair of
+    # coordinates, indexed by its position in the stream.
+    # Complexity: O(1) amortized
+    def push(self, p):
+        if not isinstance(p, V2): p = V2(p, index = self.count)
+        self.count += 1
+        self.back.push(p)
+        self.pending.append(p)
+        if (self.size is not None) and (len(self) > self.size): self.pop()
+
+    # Remove the oldest point of the window and return it.
+    # Complexity: O(1) amortized
+    def pop(self):
+        front = self.front
+        if front.iter.i < 0:
+            if not self.pending: return None
+            front = self.front = Melkman(
+                list(reversed(self.pending)), history = None
+            )
+            front.run()
+            self.pending.clear()
+            self.back = Stream()
+
+        p = front.iter.current
+        history = front.history
+        # The point changed the hull: undo its step. Otherwise it was
+        # inside the hull, which is left as is.
+        if history and (history[-1].index == front.iter.i - 1):
+            front.rewind()
+        else: front.iter.i -= 1
+        return p
+
+    # Vertices of the window's hull, as a cycle without repetition.
+    # Complexity: O(h1 + h2)
+    @property
+    def hull(self): return convex.union(self.front.hull, self.back.hull)
+
     def __repr__(self): return ", ".join(
         str(p.index) for p in self.hull
-    ) if self.hull else "∅"
+    ) if len(self) else "∅"
@@ -1,6 +1,11 @@
+import random
 import ui
 from utils import Table
+from vector import V2
 from melkman import Melkman
+from runner import Runner
+from scheduler import Scheduler
+from timeline import Timeline
 from spc import SimplePolygonalChain as SPC
 
 class Mode:
@@ -48,6 +53,7 @@ class Step(Mode):
         self.melkman = Melkman(spc)
         self.m1 = Melkman(spc)
         self.m2 = Melkman([])
+        self.timeline = None
 
     @property
     def latestp(self): return self.m1.iter.current
@@ -65,7 +71,29 @@ class Step(Mode):
             self.m1, self.m2 = self.m1.split()
         self.m2.rewind()
 
-    def delete_last(self): self.m1.rewind()
+    # Whether `m1` runs over the whole chain, as after `scrub`: its step is
+    # a step of the timeline.
+    @property
+    def whole(self):
+        return (self.m1.spc is self.melkman.spc) and (not self.m2.hull)
+
+    # Past the history of `m1` (e.g. after scrubbing), go back to the
+    # previous hull change through the timeline, like `rewind` does.
+    def delete_last(self):
+        if self.m1.history or (not self.whole): return self.m1.rewind()
+        if self.timeline is None: self.timeline = Timeline(self.melkman.spc)
+        j = self.timeline.entry(self.m1.iter.i)
+        if j > 0: self.scrub(self.timeline.steps[j - 1])
+
+    # Show the hull once point `k` of the chain has been processed; the next
+    # steps go on from there. Nothing changes if `m1` is there already, so
+    # that moving the slider to the current step is harmless.
+    def scrub(self, k):
+        if self.whole and (k == self.m1.iter.i): return
+        if self.timeline is None: self.timeline = Timeline(self.melkman.spc)
+        self.m1 = self.timeline.melkman(k)
+        self.m2 = Melkman([])
+        self.window.update()
 
     def delete(self, i):
         if   i ==  0: self.delete_first()
@@ -73,36 +101,79 @@ class Step(Mode):
 
         self.window.update()
 
+# Thin viewer over a `runner.Runner`: trials run in worker processes, a
+# `Scheduler` thread collects their results and rebuilds the chain to show
+# (the latest one, or the first failing one) at most `FPS` times per second.
+# The Tk thread only redraws.
 class Test(Mode):
     NPOINTS = 300
     CHECKS  = 5000
-    SLICES  = 10
+    POLL    = 0.05
+    FPS     = 20
 
     def __init__(self, window):
         Mode.__init__(self, window)
-        self.passed  = 0
-        self.failed  = 0
-        self.cancel  = False
+        self.runner = Runner(
+            self.area, self.NPOINTS, self.CHECKS,
+            seed = random.randrange(2**31),
+        )
+        self.scheduler = Scheduler(window, fps = self.FPS)
+        self.cancelled = False
+
+    @property
+    def passed(self): return self.runner.passed
 
     @property
-    def checks(self): return self.passed + self.failed
+    def failed(self): return self.runner.failed
 
     @property
-    def slice(self): return (self.checks % self.SLICES == 0)
+    def checks(self): return self.runner.done
+
+    @property
+    def throughput(self): return self.runner.throughput
 
     @property
     def finished(self): return self.checks >= self.CHECKS
 
+    @property
+    def cancel(self): return self.cancelled
+
+    @cancel.setter
+    def cancel(self, value):
+        self.cancelled = value
+        if value:
+            self.scheduler.cancel()
+            self.runner.cancel()
+
     def next(self, *args):
-        while not self.finished and not self.cancel:
-            self.melkman = Melkman(SPC.generate(
-                self.area, self.NPOINTS
-            ))
-            self.melkman.run()
-            if self.melkman.check():
-                self.passed += 1
-                if self.slice: self.window.update()
-            else: self.failed += 1 ; return False
+        if self.runner.start_time is not None: return
+        self.runner.start()
+        self.scheduler.start(
+            self.results, self.replay, self.show, done = self.window.update
+        )
+
+    # Yield the trials' results as they come, up to the first failure.
+    # Runs on the scheduler's thread.
+    def results(self, cancelled):
+        while not (self.runner.finished or cancelled.is_set()):
+            for r in self.runner.poll():
+                yield r
+                if not r.passed: return self.runner.cancel()
+            cancelled.wait(self.POLL)
+
+    # Rebuild and run the chain of `result`, from its points or its seed.
+    # Runs on the scheduler's thread.
+    def replay(self, result):
+        spc = [V2(p, index = i) for i, p in enumerate(result.points)] \
+              if result.points else \
+              SPC.generate(self.runner.area, self.NPOINTS,
+                           seed = result.seed)
+        melkman = Melkman(spc, history = 0)
+        melkman.run()
+        return melkman
+
+    def show(self, melkman):
+        self.melkman = melkman
 
     def delete(self, i): pass
 
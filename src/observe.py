@@ -0,0 +1,114 @@
+import math
+import itertools
+import tracing
+
+# Hull change caused by one point: `point` was pushed at both ends of the
+# deque after popping `left` (in popleft order) and `right` (in pop order).
+# For an undone step (`undo`), `point` was removed from both ends and `left`
+# and `right` were put back.
+class Diff:
+    __slots__ = ("index", "point", "left", "right", "undo")
+
+    def __init__(self, index, point, left, right, undo = False):
+        self.index = index
+        self.point = point
+        self.left  = left
+        self.right = right
+        self.undo  = undo
+
+    def __repr__(self):
+        kind = "undo" if self.undo else "push"
+        return f"<Diff {kind} {self.index}: -{len(self.left)}" \
+               f" -{len(self.right)}>"
+
+def twice(a, b): return a.x * b.y - a.y * b.x
+
+def length(a, b): return math.hypot(b.x - a.x, b.y - a.y)
+
+# Observer of a `Melkman` instance: receives a `Diff` for each point which
+# changed the hull (`on_diff`, or the `callback` given) and keeps aggregates
+# of the hull up to date without walking it:
+# * `size`: number of vertices.
+# * `area` and `perimeter`, from running sums over the deque's consecutive
+# pairs, updated with the popped points only.
+# * `bounds`: (xmin, ymin, xmax, ymax) of the processed points, which is the
+# bounding box of the hull.
+# Updates cost O(1) amortized per point; undoing a step (`rewind`) recomputes
+# the aggregates in O(h).
+#
+#   observer = melkman.observe(observe.Observer())
+#   melkman.run()
+#   observer.area, observer.perimeter
+class Observer(tracing.Tracer):
+    def __init__(self, callback = None):
+        self.callback = callback
+        self.sum    = 0
+        self.edges  = 0.0
+        self.size   = 0
+        self.bounds = None
+        self.front  = None
+
+    @property
+    def area(self): return abs(self.sum) / 2
+
+    @property
+    def perimeter(self): return self.edges
+
+    def on_diff(self, melkman, diff):
+        if self.callback is not None: self.callback(melkman, diff)
+
+    # Start from the current hull of `melkman`.
+    def on_attach(self, melkman): self.reset(melkman)
+
+    # Recompute every aggregate from `melkman.hull`.
+    # Complexity: O(h)
+    def reset(self, melkman):
+        hull = melkman.hull
+        pairs = list(zip(hull, itertools.islice(hull, 1, None)))
+        self.sum    = sum(twice(a, b) for a, b in pairs)
+        self.edges  = sum(length(a, b) for a, b in pairs)
+        self.size   = max(len(hull) - 1, 0)
+        self.bounds = (
+            min(p.x for p in hull), min(p.y for p in hull),
+            max(p.x for p in hull), max(p.y for p in hull),
+        ) if hull else None
+        self.front  = hull[0] if hull else None
+
+    def extend(self, p):
+        if self.bounds is None: self.bounds = (p.x, p.y, p.x, p.y)
+        else:
+            xmin, ymin, xmax, ymax = self.bounds
+            self.bounds = (
+                min(xmin, p.x), min(ymin, p.y),
+                max(xmax, p.x), max(ymax, p.y),
+            )
+
+    # The hull has at most 4 points during the initialization.
+    def on_init(self, melkman, p, left, right):
+        self.reset(melkman)
+        self.on_diff(melkman, Diff(melkman.iter.i, p, left, right))
+
+    # The hull went from (left..., a, ..., b, reversed(right)...) to
+    # (p, a, ..., b, p): remove the terms of the popped pairs, add (p, a)
+    # and (b, p).
+    def on_step(self, melkman, p, left, right):
+        hull = melkman.hull
+        a, b = hull[1], hull[-2]
+        s, e = self.sum, self.edges
+        for chain in ((*left, a), (b, *reversed(right))):
+            for i in range(len(chain) - 1):
+                s -= twice(chain[i], chain[i + 1])
+                e -= length(chain[i], chain[i + 1])
+        self.sum = s + twice(p, a) + twice(b, p)
+        self.edges = e + length(p, a) + length(b, p)
+        self.size = len(hull) - 1
+        self.extend(p)
+        self.front = p
+        self.on_diff(melkman, Diff(melkman.iter.i, p, left, right))
+
+    def on_rewind(self, melkman, entry):
+        p = self.front
+        self.reset(melkman)
+        self.on_diff(melkman, Diff(
+            entry.index + 1, p, entry.left, entry.right, undo = True
+        ))
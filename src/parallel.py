@@ -0,0 +1,100 @@
+import os
+import collections
+from array import array
+import concurrent.futures
+import engine
+import convex
+from points import PointArray
+from vector import V2
+from melkman import Melkman
+
+# Parallel divide-and-conquer hull for very long chains. The chain is cut
+# into contiguous sub-chains, which are simple chains too; each one is hulled
+# by the Melkman algorithm in a worker process, then the partial hulls are
+# merged pairwise like `Melkman.merge` does.
+#
+# Merging drops every vertex collinear with its neighbours, so the result is
+# the cycle of strictly convex vertices, not the deque of a serial run: the
+# serial deque may start (and end) at a point collinear with its neighbours,
+# the last one pushed, which is common with integer chains whose points line
+# up on the border of their area. `strict` gives the same cycle from a serial
+# run, to compare both.
+
+# Vertices of the hull of the sub-chain `xs`, `ys`, whose first point is
+# `spc[first]`, as indices into `spc` (without the closing repetition).
+# Executed in worker processes, with the index-based engines.
+def part(xs, ys, first):
+    xs, ys = xs.tolist(), ys.tolist()
+    dq = collections.deque()
+    engine.select(xs, ys)(xs, ys, 0, len(xs), dq)
+    dq.pop()
+    return [first + i for i in dq]
+
+# Coordinates of `spc[a:b]` as two packed columns (int64 if they are
+# integers, float64 otherwise), cheap to send to a worker.
+def columns(spc, a, b):
+    if isinstance(spc, PointArray): xs, ys = spc.xs[a:b], spc.ys[a:b]
+    else: xs, ys = [p.x for p in spc[a:b]], [p.y for p in spc[a:b]]
+    if not isinstance(xs, list): xs, ys = xs.tolist(), ys.tolist()
+    code = "q" if engine.integral(xs, ys) else "d"
+    return array(code, xs), array(code, ys)
+
+# Point `i` of `spc`, indexed by its position.
+def point(spc, i):
+    p = spc[i]
+    return V2(p.x, p.y, index = i)
+
+# Strictly convex vertices of a hull given like `engine.hull` returns it
+# (`positions` in `spc`, `rotation`), arranged like `hull` returns them.
+# Complexity: O(h)
+def strict(spc, positions, rotation):
+    if (len(positions) >= 2) and (positions[0] == positions[-1]):
+        positions = positions[:-1]
+    cycle = convex.union([point(spc, i) for i in positions], [])
+    return [p.index for p in convex.arrange(cycle, rotation)], rotation
+
+# Merge the partial hulls `hulls` (lists of points) pairwise, in ~log2(k)
+# rounds, into the vertices of their union's hull.
+# Complexity: O(h log k) for k hulls of at most h vertices
+def reduce(hulls):
+    while len(hulls) > 1:
+        merged = [
+            convex.union(hulls[i], hulls[i + 1])
+            for i in range(0, len(hulls) - 1, 2)
+        ]
+        if len(hulls) % 2: merged.append(hulls[-1])
+        hulls = merged
+    return hulls[0]
+
+# Hull of `spc` (list of `V2` or `PointArray`) computed with `workers`
+# processes (default: one per CPU), cutting it into `parts` sub-chains
+# (default: `workers`). Like `engine.hull`, returns positions in `spc` and
+# the rotation of the serial run, but the positions are the strictly convex
+# vertices only: the cycle turns with the rotation and starts and ends at
+# the vertex with the highest position, as `strict` arranges them.
+# Complexity: O(n / workers + h log parts), plus sending the chain to the
+# workers
+def hull(spc, workers = None, parts = None):
+    workers = workers or os.cpu_count() or 1
+    parts = parts or workers
+    n = len(spc)
+    # Too short to cut: run the same engine as the workers, in process.
+    if (parts <= 1) or (n < 4 * parts): return strict(spc, *engine.hull(spc))
+
+    # The rotation is set by the first non-collinear points of the chain,
+    # which is usually found after a few points.
+    melkman = Melkman(spc, history = 0)
+    while (not melkman.initialized) and (not melkman.iter.finished):
+        melkman.next()
+    if not melkman.initialized: return strict(spc, *engine.hull(spc))
+
+    bounds = [n * k // parts for k in range(parts + 1)]
+    with concurrent.futures.ProcessPoolExecutor(workers) as executor:
+        futures = [
+            executor.submit(part, *columns(spc, a, b), a)
+            for a, b in zip(bounds, bounds[1:])
+        ]
+        hulls = [[point(spc, i) for i in f.result()] for f in futures]
+
+    cycle = convex.arrange(reduce(hulls), melkman.rotation)
+    return [p.index for p in cycle], melkman.rotation
@@ -0,0 +1,55 @@
+from array import array
+from vector import V2
+
+# Columnar storage for a simple polygonal chain. Coordinates are kept in two
+# flat arrays instead of one `V2` per point, which divides the memory
+# footprint of large chains by ~8. Points are handed out as short-lived `V2`
+# views, so `PointArray` can be used wherever a list of `V2` is expected
+# (`Melkman`, `Iter`, `SimplePolygonalChain`).
+# `index` is an optional column holding each point's original index. When it
+# is None, the index of a point is its position in the array.
+class PointArray:
+    def __init__(self, xs = None, ys = None, index = None, typecode = "d"):
+        self.xs = xs if xs is not None else array(typecode)
+        self.ys = ys if ys is not None else array(typecode)
+        self.index = index
+
+    @classmethod
+    def from_points(cls, points, typecode = "d"):
+        spc = cls(typecode = typecode)
+        for p in points: spc.append(p if isinstance(p, V2) else V2(p))
+        return spc
+
+    def __len__(self): return len(self.xs)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice): return self.__class__(
+            self.xs[key], self.ys[key],
+            index = array("q", self.indices()[key])
+        )
+        if key < 0: key += len(self)
+        return V2(self.xs[key], self.ys[key], index = self.indices()[key])
+
+    def __iter__(self):
+        for i in range(len(self)): yield self[i]
+
+    # Original indices of the points: the `index` column, or their positions.
+    def indices(self):
+        return self.index if self.index is not None else range(len(self))
+
+    # Append `p`. The `index` column is only materialized once a point does
+    # not sit at its own position.
+    def append(self, p):
+        i = len(self) if p.index is None else p.index
+        if (self.index is None) and (i != len(self)):
+            self.index = array("q", range(len(self)))
+        self.xs.append(p.x)
+        self.ys.append(p.y)
+        if self.index is not None: self.index.append(i)
+
+    # (n, 2) NumPy array of the coordinates.
+    def numpy(self):
+        import numpy as np
+        return np.column_stack((self.xs, self.ys))
+
+    def __repr__(self): return f"<PointArray({len(self)})>"
@@ -0,0 +1,156 @@
+import os
+import sys
+import json
+import time
+import argparse
+import concurrent.futures
+import validate
+from utils import Table
+from vector import V2
+from melkman import Melkman
+from spc import SimplePolygonalChain as SPC
+
+# Run the trials identified by `seeds`: generate a chain restricted to `area`
+# from each seed, run the Melkman algorithm on it and check the hull. Without
+# history, the run goes through the integer engine (generated chains have
+# integer coordinates).
+# Executed in worker processes, the chain itself is only sent back on
+# failure.
+def trials(area, npoints, seeds):
+    results = []
+    for seed in seeds:
+        spc = SPC.generate(area, npoints, seed = seed)
+        melkman = Melkman(spc, history = 0)
+        melkman.run()
+        report = validate.check(melkman)
+        passed = report.valid
+        results.append(Table(
+            seed   = seed,
+            n      = len(spc),
+            passed = passed,
+            point  = None if passed else report.point.index,
+            points = None if passed else [(p.x, p.y) for p in spc],
+        ))
+    return results
+
+# Headless robustness test. `checks` trials are spread over a process pool in
+# batches of `batch` consecutive seeds starting at `seed`, so that any trial
+# can be replayed from its seed alone. Failing chains are also saved as JSON
+# files in `failures` (if not None).
+class Runner:
+    def __init__(self, area, npoints = 300, checks = 5000, workers = None,
+                 seed = 0, batch = 50, failures = "failures"):
+        self.area     = area
+        self.npoints  = npoints
+        self.checks   = checks
+        self.workers  = workers
+        self.seed     = seed
+        self.batch    = batch
+        self.failures = failures
+        self.passed   = 0
+        self.failed   = 0
+        self.start_time = None
+        self.executor = None
+        self.pending  = set()
+
+    @property
+    def done(self): return self.passed + self.failed
+
+    @property
+    def finished(self):
+        return (self.start_time is not None) and (not self.pending)
+
+    # Processed chains per second since `start`.
+    @property
+    def throughput(self):
+        if self.start_time is None: return 0.0
+        elapsed = time.perf_counter() - self.start_time
+        return self.done / elapsed if elapsed > 0 else 0.0
+
+    def start(self):
+        self.start_time = time.perf_counter()
+        self.executor = concurrent.futures.ProcessPoolExecutor(self.workers)
+        for first in range(self.seed, self.seed + self.checks, self.batch):
+            last = min(first + self.batch, self.seed + self.checks)
+            self.pending.add(self.executor.submit(
+                trials, self.area, self.npoints, range(first, last)
+            ))
+        return self
+
+    def collect(self, future):
+        self.pending.discard(future)
+        results = future.result()
+        for r in results:
+            if r.passed: self.passed += 1
+            else: self.failed += 1 ; self.save(r)
+        if not self.pending: self.executor.shutdown()
+        return results
+
+    # Return the results available now, without blocking.
+    def poll(self):
+        results = []
+        for future in [f for f in self.pending if f.done()]:
+            results.extend(self.collect(future))
+        return results
+
+    # Yield results as soon as they are available, until all trials are done.
+    def stream(self):
+        for future in concurrent.futures.as_completed(list(self.pending)):
+            yield from self.collect(future)
+
+    def cancel(self):
+        if self.executor is None: return
+        self.executor.shutdown(wait = False, cancel_futures = True)
+        self.pending.clear()
+
+    def save(self, result):
+        if self.failures is None: return
+        os.makedirs(self.failures, exist_ok = True)
+        path = os.path.join(self.failures, f"failure-{result.seed}.json")
+        with open(path, "w") as f: json.dump({
+            "seed":    result.seed,
+            "area":    vars(self.area),
+            "npoints": self.npoints,
+            "point":   result.point,
+            "points":  result.points,
+        }, f)
+
+    # Rebuild a `Melkman` instance, not yet run, from a saved failure.
+    @classmethod
+    def replay(cls, path):
+        with open(path) as f: failure = json.load(f)
+        return Melkman([
+            V2(p, index = i) for i, p in enumerate(failure["points"])
+        ])
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description = "Headless Melkman robustness test."
+    )
+    parser.add_argument("--checks",   type = int, default = 5000)
+    parser.add_argument("--npoints",  type = int, default = 300)
+    parser.add_argument("--workers",  type = int, default = None)
+    parser.add_argument("--seed",     type = int, default = 0)
+    parser.add_argument("--width",    type = int, default = 800)
+    parser.add_argument("--height",   type = int, default = 600)
+    parser.add_argument("--failures", default = "failures")
+    args = parser.parse_args()
+
+    runner = Runner(
+        area     = Table(x = 0, y = 0, width = args.width,
+                         height = args.height),
+        npoints  = args.npoints,
+        checks   = args.checks,
+        workers  = args.workers,
+        seed     = args.seed,
+        failures = args.failures,
+    ).start()
+    for r in runner.stream():
+        if not r.passed: print(
+            f"failed: seed {r.seed}, point {r.point}", file = sys.stderr
+        )
+    print(
+        f"checks: ✓ {runner.passed} / X {runner.failed} / N {runner.checks}"
+        f" | {runner.throughput:.0f} chains/s"
+    )
+    sys.exit(1 if runner.failed else 0)
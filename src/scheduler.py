@@ -0,0 +1,91 @@
+import time
+import queue
+import threading
+
+# Run algorithm work on a worker thread and hand its results to the Tk thread.
+# A job yields items (e.g. one per step or per finished chain); the worker
+# checks for cancellation after each item, and at most `fps` times per second
+# turns the latest item into a snapshot which is sent to the Tk thread
+# through a queue. The Tk thread polls the queue at the same rate and only
+# shows the newest snapshot: redraws are coalesced, and Tk calls never happen
+# outside of the Tk thread.
+class Task:
+    def __init__(self, job, snapshot, interval):
+        self.cancelled = threading.Event()
+        self.snapshots = queue.Queue(maxsize = 1)
+        self.thread = threading.Thread(
+            target = self.work, args = (job, snapshot, interval),
+            daemon = True,
+        )
+        self.error = None
+
+    @property
+    def alive(self): return self.thread.is_alive()
+
+    # Keep only the newest snapshot in the queue.
+    def publish(self, snapshot):
+        while True:
+            try: return self.snapshots.put_nowait(snapshot)
+            except queue.Full:
+                try: self.snapshots.get_nowait()
+                except queue.Empty: pass
+
+    def work(self, job, snapshot, interval):
+        deadline = time.perf_counter() + interval
+        latest = due = None
+        try:
+            for latest in job(self.cancelled):
+                if self.cancelled.is_set(): return
+                due = True
+                if time.perf_counter() < deadline: continue
+                self.publish(snapshot(latest))
+                deadline = time.perf_counter() + interval
+                due = False
+            if due and not self.cancelled.is_set():
+                self.publish(snapshot(latest))
+        except Exception as e: self.error = e
+
+    # Newest snapshot, or None.
+    def poll(self):
+        try: return self.snapshots.get_nowait()
+        except queue.Empty: return None
+
+class Scheduler:
+    def __init__(self, window, fps = 30):
+        self.window = window
+        self.interval = 1.0 / fps
+        self.task = None
+
+    @property
+    def running(self): return (self.task is not None) and self.task.alive
+
+    # Run `job(cancelled)` on a worker thread, where `cancelled` is a
+    # `threading.Event` that long waits inside the job should honour. Each
+    # snapshot `snapshot(item)` is passed to `show` on the Tk thread, which
+    # is then redrawn. `done` is called on the Tk thread once the job ends
+    # (not when cancelled). Any running job is cancelled first.
+    def start(self, job, snapshot, show, done = None):
+        self.cancel()
+        task = self.task = Task(job, snapshot, self.interval)
+        task.thread.start()
+        self.window.after(self.delay, self.pump, task, show, done)
+
+    @property
+    def delay(self): return max(1, round(1e3 * self.interval))
+
+    def pump(self, task, show, done):
+        if task.cancelled.is_set(): return
+        alive = task.alive
+        snapshot = task.poll()
+        if snapshot is not None:
+            show(snapshot)
+            self.window.update()
+        if alive: self.window.after(self.delay, self.pump, task, show, done)
+        else:
+            if task.error is not None: raise task.error
+            if done is not None: done()
+
+    # Ask the running job to stop: the worker stops after its current item
+    # and nothing more is shown.
+    def cancel(self):
+        if self.task is not None: self.task.cancelled.set()
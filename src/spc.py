@@ -1,32 +1,99 @@
+import math
 import random
+import kernel
 from vector import V2
+from grid import SegmentGrid
 
 class SimplePolygonalChain:
     # Generate a simple polygonal chain containing at most `n` points and
-    # restricted to `area`.
-    # Complexity: O(n^2)
+    # restricted to `area`. Points are appended to `spc` (a new list by
+    # default, or e.g. an empty `PointArray`). Points are drawn from the
+    # global `random` state, or from `random.Random(seed)` if `seed` is given.
+    # Complexity: O(n^2) worst case, O(n) segment tests per point in a
+    # `SegmentGrid` cell neighbourhood otherwise
     @classmethod
-    def generate(cls, area, n):
-        spc = []
+    def generate(cls, area, n, seed = None, spc = None):
+        if spc is None: spc = []
+        rng = random if seed is None else random.Random(seed)
+        grid = SegmentGrid()
         for _ in range(n):
             p = V2(
-                random.randrange(area.x, area.width),
-                random.randrange(area.y, area.height),
+                rng.randrange(area.x, area.width),
+                rng.randrange(area.y, area.height),
                 index = len(spc),
             )
-            if cls.check_1(spc, p): spc.append(p)
+            if cls.check_1(spc, p, grid): spc.append(p)
+        return spc
+
+    # Draw `n` distinct points with integer coordinates in `area`, using a
+    # `random.Random(seed)` generator.
+    @classmethod
+    def sample(cls, area, n, seed = None):
+        w = area.width - area.x
+        h = area.height - area.y
+        if n > w * h: raise ValueError(
+            f"cannot draw {n} distinct points from a {w}x{h} area"
+        )
+        return [
+            (area.x + k % w, area.y + k // w)
+            for k in random.Random(seed).sample(range(w * h), n)
+        ]
+
+    # Generate a simple polygonal chain of exactly `n` points restricted to
+    # `area`. Points are sorted by (x, y): the chain is x-monotone, hence
+    # simple.
+    # Complexity: O(n log n)
+    @classmethod
+    def monotone(cls, area, n, seed = None, spc = None):
+        if spc is None: spc = []
+        for i, p in enumerate(sorted(cls.sample(area, n, seed))):
+            spc.append(V2(p, index = i))
+        return spc
+
+    # Generate a simple polygonal chain of exactly `n` points restricted to
+    # `area`. Points are sorted by angle around a center no line through two
+    # integer points can cross (irrational offsets), so no two points share
+    # an angle. The chain starts right after the widest angular gap: every
+    # segment then spans less than half a turn and stays in its own wedge,
+    # which makes the chain simple (star-shaped).
+    # Complexity: O(n log n)
+    @classmethod
+    def star(cls, area, n, seed = None, spc = None):
+        if spc is None: spc = []
+        cx = (area.x + area.width) / 2 + math.sqrt(2) / 4
+        cy = (area.y + area.height) / 2 + math.sqrt(3) / 4
+        points = sorted(
+            cls.sample(area, n, seed),
+            key = lambda p: math.atan2(p[1] - cy, p[0] - cx),
+        )
+        angles = [math.atan2(y - cy, x - cx) for x, y in points]
+        gaps = [
+            (angles[(i + 1) % n] - angles[i]) % (2 * math.pi)
+            for i in range(n)
+        ]
+        start = (max(range(n), key = gaps.__getitem__) + 1) % n if n else 0
+        for i, p in enumerate(points[start:] + points[:start]):
+            spc.append(V2(p, index = i))
         return spc
 
     # Given `spc`, a simple polygonal chain, check if the property is still
     # true for `spc U {p}`.
-    # Complexity: O(n)
+    # If `grid`, a `SegmentGrid` persisting alongside `spc`, is given, only
+    # the segments near [spc[-1], p] are tested. The grid is brought up to
+    # date with `spc` first.
+    # Complexity: O(n) without `grid`
     @classmethod
-    def check_1(cls, spc, p):
+    def check_1(cls, spc, p, grid = None):
         if len(spc) <= 1: return True
-        for i, _ in enumerate(spc):
-            if i == len(spc) - 1: break
-            if V2.intersection(
-                a = spc[i],  b = spc[i + 1],
-                c = spc[-1], d = p,
+        c = spc[-1]
+        last = len(spc) - 2
+        if grid is not None: grid.update(spc)
+        segments = range(len(spc) - 1) if grid is None \
+              else grid.query(c, p)
+        for i in segments:
+            a, b = spc[i], spc[i + 1]
+            if kernel.intersection(
+                a.x, a.y, b.x, b.y, c.x, c.y, p.x, p.y,
+                adjacent = (i == last),
             ): return False
         return True
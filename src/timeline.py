@@ -0,0 +1,103 @@
+import bisect
+import collections
+from melkman import Melkman
+
+# Random access to the hull at any step of a run over `spc`.
+# The run keeps every history entry (the points popped for each pushed
+# point) and copies the hull from time to time (checkpoints). The hull after
+# step k is rebuilt from the closest checkpoint, or from the previous query,
+# by replaying the entries in between forwards or backwards, like `rewind`.
+# A checkpoint is taken once the deque operations since the previous one
+# outweigh the hull (and at least `every` entries passed), so checkpoints
+# take O(n) memory in total and any query replays O(h + every) operations.
+# Consecutive queries (scrubbing) only replay the entries between them.
+class Timeline:
+    def __init__(self, spc, every = 64):
+        self.spc = spc
+        melkman = Melkman(spc)
+        history = melkman.history
+
+        self.marks = [0]
+        self.hulls = [()]
+        # Rotation after each entry of the initialization; constant after.
+        self.rotations = []
+        work = 0
+        while not melkman.iter.finished:
+            count = len(history)
+            melkman.next()
+            if len(history) == count: continue
+            entry = history[-1]
+            if not melkman.initialized:
+                self.rotations.append(melkman.rotation)
+            work += 2 + len(entry.left) + len(entry.right)
+            if (len(history) - self.marks[-1] >= every) \
+            and (work >= len(melkman.hull)):
+                self.marks.append(len(history))
+                self.hulls.append(tuple(melkman.hull))
+                work = 0
+        if history: history[-1].freeze()
+
+        self.rotation = melkman.rotation
+        self.entries = list(history)
+        self.steps = [e.index for e in self.entries]
+        # Cursor: the hull after the first `j` entries.
+        self.hull = collections.deque()
+        self.j = 0
+
+    def __len__(self): return len(self.spc)
+
+    # Point pushed by entry `j`.
+    def pushed(self, j): return self.spc[self.entries[j].index + 1]
+
+    def forward(self):
+        entry = self.entries[self.j]
+        p = self.pushed(self.j)
+        for _ in entry.left:  self.hull.popleft()
+        for _ in entry.right: self.hull.pop()
+        self.hull.appendleft(p)
+        self.hull.append(p)
+        self.j += 1
+
+    def backward(self):
+        self.j -= 1
+        entry = self.entries[self.j]
+        self.hull.pop()
+        self.hull.popleft()
+        for p in entry.left[::-1]:  self.hull.appendleft(p)
+        for p in entry.right[::-1]: self.hull.append(p)
+
+    # Move the cursor to the state after `j` entries, starting from the
+    # closest checkpoint unless the cursor is closer.
+    # Complexity: O(h + every)
+    def seek(self, j):
+        c = bisect.bisect_right(self.marks, j) - 1
+        candidates = [c] + ([c + 1] if c + 1 < len(self.marks) else [])
+        best = min(candidates, key = lambda c: abs(self.marks[c] - j))
+        if abs(self.marks[best] - j) + len(self.hulls[best]) \
+         < abs(self.j - j):
+            self.hull = collections.deque(self.hulls[best])
+            self.j = self.marks[best]
+        while self.j < j: self.forward()
+        while self.j > j: self.backward()
+
+    # Number of entries recorded once point `k` has been processed.
+    def entry(self, k): return bisect.bisect_right(self.steps, k - 1)
+
+    # Hull once point `k` has been processed (-1: no point), as the cursor's
+    # deque: copy it to keep it.
+    def at(self, k):
+        self.seek(self.entry(k))
+        return self.hull
+
+    # New `Melkman` instance in the state of the run once point `k` has been
+    # processed, ready to go on. Its history starts empty.
+    def melkman(self, k):
+        hull = self.at(k)
+        j = self.j
+        melkman = Melkman(self.spc)
+        melkman.hull.extend(hull)
+        melkman.rotation = self.rotations[j - 1] \
+                           if 0 < j <= len(self.rotations) else \
+                           self.rotation if j else 0
+        melkman.iter.i = k
+        return melkman
@@ -0,0 +1,203 @@
+import time
+import collections
+import kernel
+
+# Instrumentation of `Melkman`. Nothing is instrumented unless a tracer is
+# attached: `attach` switches the instance to a traced subclass and wraps
+# its history, `detach` restores it. Untraced instances run the plain code,
+# without any check.
+#
+#   stats = tracing.attach(melkman, tracing.Stats())
+#   melkman.run()
+#   print(stats)
+
+# Callbacks received by a tracer. `left` and `right` are the points popped
+# from each end of the deque while processing `p`.
+class Tracer:
+    # The tracer was attached to `melkman`, which may have processed points
+    # already.
+    def on_attach(self, melkman): pass
+
+    # `p` went through `Melkman.init`.
+    def on_init(self, melkman, p, left, right): pass
+
+    # `p` went through `Melkman.step` and was pushed on the hull.
+    def on_step(self, melkman, p, left, right): pass
+
+    # `p` went through `Melkman.step` and was inside the hull.
+    def on_skip(self, melkman, p): pass
+
+    # A history entry was undone.
+    def on_rewind(self, melkman, entry): pass
+
+    # A history entry was created.
+    def on_entry(self, melkman, entry): pass
+
+    # A predicate of `kernel` (`rotation`, `intersection`) was called.
+    def on_predicate(self, name): pass
+
+    # `phase` (`init`, `step`, `run`, `add`, `rewind`) took `seconds`.
+    def on_phase(self, phase, seconds): pass
+
+# Tracer counting events and timing phases.
+class Stats(Tracer):
+    def __init__(self):
+        self.points     = 0
+        self.inits      = 0
+        self.restarts   = 0
+        self.steps      = 0
+        self.skips      = 0
+        self.pops_left  = 0
+        self.pops_right = 0
+        self.entries    = 0
+        self.rewinds    = 0
+        self.predicates = collections.Counter()
+        self.phases     = collections.Counter()
+
+    # An init call restarts the initialization when the 3 points of the hull
+    # are colinear: the last one is popped from the right.
+    def on_init(self, melkman, p, left, right):
+        self.points += 1
+        self.inits += 1
+        self.restarts += bool(right)
+        self.pops_left += len(left)
+        self.pops_right += len(right)
+
+    def on_step(self, melkman, p, left, right):
+        self.points += 1
+        self.steps += 1
+        self.pops_left += len(left)
+        self.pops_right += len(right)
+
+    def on_skip(self, melkman, p):
+        self.points += 1
+        self.skips += 1
+
+    def on_rewind(self, melkman, entry): self.rewinds += 1
+
+    def on_entry(self, melkman, entry): self.entries += 1
+
+    def on_predicate(self, name): self.predicates[name] += 1
+
+    def on_phase(self, phase, seconds): self.phases[phase] += seconds
+
+    def __repr__(self): return "\n".join([
+        f"points: {self.points} (init {self.inits}, restarts {self.restarts},"
+        f" steps {self.steps}, early returns {self.skips})",
+        f"pops: left {self.pops_left}, right {self.pops_right}",
+        f"history: {self.entries} entries, {self.rewinds} rewinds",
+        "predicates: " + ", ".join(
+            f"{k} {v}" for k, v in sorted(self.predicates.items())
+        ),
+        "phases: " + ", ".join(
+            f"{k} {v * 1e3:.2f}ms" for k, v in sorted(self.phases.items())
+        ),
+    ])
+
+# Count calls to the `kernel` predicates while a traced method runs. Only the
+# outermost traced call patches `kernel`, so nested calls (`add` -> `step`)
+# are not counted twice.
+class Predicates:
+    depth = 0
+    NAMES = ("rotation", "intersection")
+
+    def __init__(self, tracer): self.tracer = tracer
+
+    def __enter__(self):
+        cls = self.__class__
+        cls.depth += 1
+        if cls.depth > 1: return
+        self.saved = {name: getattr(kernel, name) for name in self.NAMES}
+        for name, f in self.saved.items():
+            setattr(kernel, name, self.counting(name, f))
+
+    def __exit__(self, *exc):
+        cls = self.__class__
+        cls.depth -= 1
+        if cls.depth > 0: return
+        for name, f in self.saved.items(): setattr(kernel, name, f)
+
+    def counting(self, name, f):
+        on_predicate = self.tracer.on_predicate
+        def counted(*args, **kwargs):
+            on_predicate(name)
+            return f(*args, **kwargs)
+        return counted
+
+TRACED = {}
+
+# Traced subclass of `cls` (`Melkman`, `Stream`), created once per class.
+def traced(cls):
+    if cls in TRACED: return TRACED[cls]
+
+    class Traced(cls):
+        def timed(self, phase, method, *args):
+            start = time.perf_counter()
+            if self.counting:
+                with Predicates(self.tracer): result = method(self, *args)
+            else: result = method(self, *args)
+            self.tracer.on_phase(phase, time.perf_counter() - start)
+            return result
+
+        def process(self, phase, method, p):
+            self.popped = ([], [])
+            self.timed(phase, method, p)
+            left, right = self.popped
+            if phase == "init": self.tracer.on_init(self, p, left, right)
+            elif self.hull and (self.hull[0] is p):
+                self.tracer.on_step(self, p, left, right)
+            else: self.tracer.on_skip(self, p)
+
+        def init(self, p): self.process("init", cls.init, p)
+
+        def step(self, p): self.process("step", cls.step, p)
+
+        # `Stream` has neither `run` nor `add`.
+        if hasattr(cls, "run"):
+            def run(self): self.timed("run", cls.run)
+
+        if hasattr(cls, "add"):
+            def add(self, p): return self.timed("add", cls.add, p)
+
+        def rewind(self):
+            entry = self.history[-1] if self.history else None
+            self.timed("rewind", cls.rewind)
+            if entry is not None: self.tracer.on_rewind(self, entry)
+
+    Traced.__name__ = Traced.__qualname__ = f"Traced{cls.__name__}"
+    TRACED[cls] = Traced
+    return Traced
+
+# Attach `tracer` to `melkman` and return it.
+def attach(melkman, tracer):
+    if melkman.__class__ in TRACED.values(): detach(melkman)
+    base = melkman.__class__
+    melkman.__class__ = traced(base)
+    melkman.tracer = tracer
+    melkman.popped = ([], [])
+    # `kernel` is only patched for tracers which count predicates.
+    melkman.counting = type(tracer).on_predicate is not Tracer.on_predicate
+
+    history = melkman.history
+    cls = history.__class__
+    def insert_left(p):
+        melkman.popped[0].append(p)
+        cls.insert_left(history, p)
+    def insert_right(p):
+        melkman.popped[1].append(p)
+        cls.insert_right(history, p)
+    def new(index):
+        cls.new(history, index)
+        if history: tracer.on_entry(melkman, history[-1])
+    history.insert_left = insert_left
+    history.insert_right = insert_right
+    history.new = new
+    tracer.on_attach(melkman)
+    return tracer
+
+# Remove the tracer of `melkman`, which runs untraced code again.
+def detach(melkman):
+    melkman.__class__ = melkman.__class__.__mro__[1]
+    del melkman.tracer, melkman.popped, melkman.counting
+    for name in ("insert_left", "insert_right", "new"):
+        melkman.history.__dict__.pop(name, None)
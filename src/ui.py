@@ -1,6 +1,8 @@
+import time
 import collections
 import tkinter as tk
 from tkinter import ttk
+from utils import Table
 
 class Window(tk.Tk):
     def __init__(self, controller):
@@ -53,6 +55,16 @@ class Window(tk.Tk):
             relief  = tk.RAISED,
             command = lambda: self.controller.delete(i = -1),
         ).grid(row = 0, column = 2, sticky = tk.W)
+        # Scrub through the steps of the run (see `timeline.Timeline`).
+        self.scrubber = tk.Scale(self.del_frame,
+            from_      = -1,
+            to         = 0,
+            orient     = tk.HORIZONTAL,
+            showvalue  = False,
+            length     = 200,
+            command    = lambda k: self.controller.scrub(int(k)),
+        )
+        self.scrubber.grid(row = 0, column = 3, sticky = tk.W, padx = 10)
 
         self.information = Information(top_frame, controller)
         self.information.grid(row = 1, column = 0, sticky = tk.W)
@@ -67,13 +79,23 @@ class Window(tk.Tk):
         self.controller.select(mode)
 
         if mode == self.controller.MODES.step:
+            # Back to the start before shrinking the range: a clamped value
+            # would scrub the new chain.
+            self.scrubber.set(-1)
+            self.scrubber.configure(to = len(self.controller.mode) - 1)
             self.del_frame.show()
         else:
             self.del_frame.hide()
 
+    # Keep the slider on the current step of Step mode.
+    def update_scrubber(self):
+        c = self.controller
+        if (c.m1 is not None) and c.whole: self.scrubber.set(c.m1.iter.i)
+
     def update(self):
         self.information.update()
         self.canvas.update()
+        self.update_scrubber()
         tk.Tk.update(self)
 
 class Information(tk.Frame):
@@ -92,9 +114,11 @@ class Information(tk.Frame):
             f"checks: ✓ {self.controller.passed}"
             f" / X {self.controller.failed}"
             f" / N {self.controller.CHECKS}"
+            f" ({self.controller.throughput:.0f} chains/s)"
         )
 
         txt.append(f"n: {len(self.controller.mode)}")
+        txt.append(f"frame: {self.controller.window.canvas.frame_time:.1f}ms")
 
         def helper(melkman, i):
             hull_str = str(melkman) if melkman else "∅"
@@ -107,7 +131,24 @@ class Information(tk.Frame):
 
         self.label["text"] = " | ".join(txt)
 
+# Retained-mode canvas: items are created once and kept, indexed by point
+# index (dots, nodes) or by pair of point indices (edges). Each update only
+# creates or deletes the items which changed since the previous one, and
+# restyles the previously and currently highlighted (latest) points.
+# Level of detail: above `DETAIL` points, the chain is drawn as polylines of
+# at most `CHUNK` points, skipping consecutive points which fall in the same
+# pixel, and only the latest point is marked. Above `LABELS` vertices, a hull
+# is drawn as a single polygon without nodes nor labels.
 class Canvas(tk.Canvas):
+    DOT  = Table(radius = 3, fill = ("gray15", "dark slate blue"),
+                 outline = ("gray15", "dark slate blue"))
+    NODE = Table(radius = 10, fill = ("white",),
+                 outline = ("firebrick2", "dark slate blue"))
+    FRAMES = 120
+    DETAIL = 2000
+    CHUNK  = 1024
+    LABELS = 100
+
     def __init__(self, parent, controller):
         self.controller = controller
 
@@ -117,94 +158,203 @@ class Canvas(tk.Canvas):
         )
         self["background"] = "white"
 
-    def draw_circle(self, center, radius, fill, outline):
-        latestp = self.controller.latestp
-        radius = radius if center != latestp else radius + 2
-        fill = fill[0] if center != latestp else fill[-1]
-        outline = outline[0] if center != latestp else outline[-1]
-
-        return self.create_oval(
+        self.chain   = Table(spc = None, n = 0, dots = {}, lod = False)
+        self.layers  = {}
+        self.latest  = None
+        self.marker  = False
+        self.frames  = collections.deque(maxlen = self.FRAMES)
+
+    # Mean duration of the last `FRAMES` updates, in ms.
+    @property
+    def frame_time(self):
+        if not self.frames: return 0.0
+        return 1e3 * sum(self.frames) / len(self.frames)
+
+    def circle(self, center, style, highlight):
+        radius = style.radius if not highlight else style.radius + 2
+        return (
             center.x - radius, center.y - radius,
             center.x + radius, center.y + radius,
-            fill          = fill,
-            outline       = outline,
+        ), dict(
+            fill    = style.fill[0] if not highlight else style.fill[-1],
+            outline = style.outline[0] if not highlight else style.outline[-1],
         )
 
-    def draw_text(self, center, text):
+    def draw_circle(self, center, style, tags):
+        coords, options = self.circle(
+            center, style, center.index == self.latest
+        )
+        return self.create_oval(*coords, **options, tags = tags)
+
+    def restyle_circle(self, item, center, style, highlight):
+        coords, options = self.circle(center, style, highlight)
+        self.coords(item, *coords)
+        self.itemconfigure(item, **options)
+
+    def draw_text(self, center, text, tags):
         return self.create_text(
             center.x, center.y,
             text       = text,
             fill       = "gray15",
+            tags       = tags,
         )
 
-    def draw_edges(self, collection, color, width, dash):
-        for i, _ in enumerate(collection):
-            if i == len(collection) - 1: return
-            p1 = collection[i]
-            p2 = collection[i + 1]
-            self.create_line(
-                p1.x, p1.y,
-                p2.x, p2.y,
-                fill  = color,
-                width = width,
-                dash = dash,
-            )
+    def draw_edge(self, p1, p2, color, width, dash, tags):
+        return self.create_line(
+            p1.x, p1.y,
+            p2.x, p2.y,
+            fill  = color,
+            width = width,
+            dash  = dash,
+            tags  = tags,
+        )
 
-    def draw_nodes(self, collection):
-        for p in collection:
-            self.draw_circle(
-                center     = p,
-                radius     = 10,
-                fill       = ("white",),
-                outline    = ("firebrick2", "dark slate blue"),
+    def draw_spc_edge(self, p1, p2): return self.draw_edge(p1, p2,
+        color = "gray15",
+        width = 1,
+        dash  = (5, 5),
+        tags  = "spc",
+    )
+
+    def draw_hull_edge(self, p1, p2, tags): return self.draw_edge(p1, p2,
+        color = "firebrick2",
+        width = 2,
+        dash  = None,
+        tags  = tags,
+    )
+
+    # Draw the points of `spc` appended since the previous update. The chain
+    # is redrawn from scratch if it is a new one, or if it crossed `DETAIL`.
+    def update_chain(self, spc):
+        chain = self.chain
+        lod = (spc is not None) and (len(spc) > self.DETAIL)
+        if (spc is not chain.spc) or (len(spc or ()) < chain.n) \
+        or (lod != chain.lod):
+            self.delete("spc")
+            chain.spc, chain.n, chain.dots, chain.lod = spc, 0, {}, lod
+            chain.line, chain.coords, chain.pixel = None, [], None
+        if spc is None: return
+
+        if lod: return self.update_polyline(spc)
+        for i in range(chain.n, len(spc)):
+            p = spc[i]
+            if i > 0: self.draw_spc_edge(spc[i - 1], p)
+            chain.dots[p.index] = (p, self.draw_circle(p, self.DOT, "spc"))
+        chain.n = len(spc)
+
+    # Extend the chain's polylines with the points appended to `spc`. Only the
+    # last polyline (at most `CHUNK` points) is resent to Tk.
+    def update_polyline(self, spc):
+        chain = self.chain
+        def flush():
+            if len(chain.coords) < 4: return
+            if chain.line is None: chain.line = self.create_line(
+                *chain.coords, fill = "gray15", width = 1, tags = "spc",
             )
-            self.draw_text(p, str(p.index))
-
-    def draw_dots(self, collection):
-        for p in collection:
-            self.draw_circle(
-                center     = p,
-                radius     = 3,
-                fill       = ("gray15", "dark slate blue"),
-                outline    = ("gray15", "dark slate blue"),
+            else: self.coords(chain.line, *chain.coords)
+
+        for i in range(chain.n, len(spc)):
+            p = spc[i]
+            pixel = (int(p.x), int(p.y))
+            if pixel == chain.pixel: continue
+            chain.pixel = pixel
+            if len(chain.coords) >= 2 * self.CHUNK:
+                flush()
+                chain.line, chain.coords = None, chain.coords[-2:]
+            chain.coords.extend(pixel)
+        chain.n = len(spc)
+        flush()
+
+    # Synchronize the layer `name` with `melkman.hull`: delete the nodes and
+    # edges which left the hull, draw the ones which entered it. All items of
+    # the layer are tagged with `name`.
+    # Above `LABELS` vertices, the layer is a single polygon instead.
+    def update_hull(self, name, melkman):
+        hull = list(melkman.hull) if melkman is not None else []
+        lod = len(hull) > self.LABELS
+        layer = self.layers.get(name)
+        if (layer is None) or (layer.melkman is not melkman) \
+        or (layer.lod != lod):
+            self.delete(name)
+            layer = self.layers[name] = Table(
+                melkman = melkman, nodes = {}, edges = {},
+                lod = lod, polygon = None,
             )
 
-    def draw_spc_edges(self, collection):
-        self.draw_edges(collection,
-            color = "gray15",
-            width = 1,
-            dash  = (5, 5),
-        )
-
-    def draw_hull_edges(self, collection):
-        self.draw_edges(collection,
-            color = "firebrick2",
-            width = 2,
-            dash  = None,
-        )
+        if lod:
+            coords = [c for p in hull for c in (p.x, p.y)]
+            if layer.polygon is None: layer.polygon = self.create_polygon(
+                *coords,
+                fill    = "",
+                outline = "firebrick2",
+                width   = 2,
+                tags    = (name, "hull"),
+            )
+            else: self.coords(layer.polygon, *coords)
+            return
+
+        nodes = {p.index: p for p in hull}
+        edges = {
+            (hull[i].index, hull[i + 1].index): (hull[i], hull[i + 1])
+            for i in range(len(hull) - 1)
+        }
+        for k in [k for k in layer.nodes if k not in nodes]:
+            self.delete(*layer.nodes.pop(k)[1:])
+        for k in [k for k in layer.edges if k not in edges]:
+            self.delete(layer.edges.pop(k))
+        for k, p in nodes.items():
+            if k not in layer.nodes: layer.nodes[k] = (
+                p,
+                self.draw_circle(p, self.NODE, (name, "node")),
+                self.draw_text(p, str(p.index), (name, "node")),
+            )
+        for k, (p1, p2) in edges.items():
+            if k not in layer.edges:
+                layer.edges[k] = self.draw_hull_edge(p1, p2, (name, "hull"))
 
-    def draw_bridges(self, m1, m2):
+    def update_bridges(self, m1, m2):
+        self.delete("bridge")
         if (m1 is None) or (m2 is None): return
 
-        tangents = m1.bridge(m2)
-        for t in tangents: self.draw_edges(t,
+        for a, b in m1.bridge(m2): self.draw_edge(a, b,
             color = "green",
             width = 2,
-            dash = None,
+            dash  = None,
+            tags  = "bridge",
         )
 
-    def draw(self, melkman, spc = True, hull = True):
-        if melkman is None: return
-        if spc:
-            self.draw_spc_edges(melkman.spc)
-            self.draw_dots(melkman.spc)
-        if hull:
-            self.draw_hull_edges(melkman.hull)
-            self.draw_nodes(melkman.hull)
+    # Move the highlight from the previous latest point to `latestp`.
+    def update_latest(self, latestp):
+        latest = latestp.index if latestp is not None else None
+        if latest == self.latest: return
+        for key, highlight in ((self.latest, False), (latest, True)):
+            if key is None: continue
+            if key in self.chain.dots:
+                p, item = self.chain.dots[key]
+                self.restyle_circle(item, p, self.DOT, highlight)
+            for layer in self.layers.values():
+                if key in layer.nodes:
+                    p, item, _ = layer.nodes[key]
+                    self.restyle_circle(item, p, self.NODE, highlight)
+        self.latest = latest
+
+    # Without dots (level of detail), mark the latest point on its own.
+    def update_marker(self, latestp):
+        if self.marker: self.delete("latest")
+        self.marker = self.chain.lod and (latestp is not None)
+        if self.marker:
+            coords, options = self.circle(latestp, self.DOT, True)
+            self.create_oval(*coords, **options, tags = "latest")
 
     def update(self):
-        self.delete("all")
-        self.draw(self.controller.melkman)
-        self.draw(self.controller.m1, spc = False)
-        self.draw(self.controller.m2, spc = False)
-        self.draw_bridges(self.controller.m1, self.controller.m2)
+        start = time.perf_counter()
+        c = self.controller
+        self.update_latest(c.latestp if c.melkman is not None else None)
+        self.update_chain(c.melkman.spc if c.melkman is not None else None)
+        self.update_hull("h0", c.melkman if c.m1 is None else None)
+        self.update_hull("h1", c.m1)
+        self.update_hull("h2", c.m2)
+        self.update_bridges(c.m1, c.m2)
+        self.update_marker(c.latestp if c.melkman is not None else None)
+        for tag in ("hull", "node", "bridge", "latest"): self.tag_raise(tag)
+        self.frames.append(time.perf_counter() - start)
@@ -31,3 +31,10 @@ class Iter:
         if self.i + 1 < len(self.collection):
             self.i += 1
             return self.collection[self.i]
+
+# Stands in for `Iter` when the collection is not kept: only tracks the index
+# of the current element.
+class Cursor:
+    def __init__(self): self.i = -1
+
+    def next(self): self.i += 1
@@ -0,0 +1,76 @@
+import kernel
+from utils import Table
+
+# Fast counterpart of `Melkman.check`: same verdict, in O(n log h) instead of
+# O(h·n), plus the first offending point of `spc` (in chain order).
+#
+# Once the hull is known to be a strictly convex polygon whose turns all have
+# the sign `melkman.rotation`, "P is on the inner side of every edge" is a
+# point-in-convex-polygon test, answered by a binary search over the fan of
+# triangles (v0, vi, vi+1). If the hull is not such a polygon (degenerate or
+# wrong hull), the edge-by-edge scan is used so that the verdict is the same
+# as `Melkman.check` in every case.
+def check(melkman):
+    hull = list(melkman.hull)
+    vertices = polygon(hull, melkman.rotation)
+    test = scan(hull, melkman.rotation) if vertices is None \
+      else inside(vertices, melkman.rotation)
+
+    for p in melkman.spc:
+        if not test(p): return Table(valid = False, point = p)
+    return Table(valid = True, point = None)
+
+def rot(a, b, c): return kernel.rotation(a.x, a.y, b.x, b.y, c.x, c.y)
+
+# Vertices of the closed `hull` deque as a strictly convex polygon turning
+# with sign `s`, or None if it is not one. Vertices lying in the middle of a
+# straight edge are dropped: the edge-by-edge test is unchanged without them.
+# Complexity: O(h)
+def polygon(hull, s):
+    if (s == 0) or (len(hull) < 4) or (hull[0] is not hull[-1]): return None
+    vs = hull[:-1]
+    m = len(vs)
+
+    kept = []
+    for i in range(m):
+        a, b, c = vs[i - 1], vs[i], vs[(i + 1) % m]
+        turn = rot(a, b, c)
+        if turn == s: kept.append(b)
+        elif turn == 0:
+            forward = (b.x - a.x) * (c.x - b.x) + (b.y - a.y) * (c.y - b.y)
+            if forward <= 0: return None
+        else: return None
+
+    m = len(kept)
+    if m < 3: return None
+    v0 = kept[0]
+    for i in range(1, m - 1):
+        if rot(v0, kept[i], kept[i + 1]) != s: return None
+    return kept
+
+# Point-in-convex-polygon test for `vs`, a strictly convex polygon turning
+# with sign `s`. Points on the boundary are inside.
+# Complexity: O(log h) per point
+def inside(vs, s):
+    v0, m = vs[0], len(vs)
+    def test(p):
+        if rot(v0, vs[1], p) == -s: return False
+        if rot(vs[-1], v0, p) == -s: return False
+        lo, hi = 1, m - 2
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            if rot(v0, vs[mid], p) != -s: lo = mid
+            else: hi = mid - 1
+        return rot(vs[lo], vs[lo + 1], p) != -s
+    return test
+
+# Edge-by-edge test of `Melkman.check`.
+# Complexity: O(h) per point
+def scan(hull, s):
+    edges = [(hull[i], hull[i + 1]) for i in range(len(hull) - 1)]
+    def test(p):
+        for a, b in edges:
+            r = rot(a, b, p)
+            if (r != s) and (r != 0): return False
+        return True
+    return test
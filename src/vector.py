@@ -1,4 +1,9 @@
+import kernel
+
 class V2:
+    # No per-instance `__dict__`, chains may hold millions of points.
+    __slots__ = ("x", "y", "index")
+
     def __init__(self, *args, index = None):
         self.index = index
         if len(args) == 1:
@@ -40,19 +45,17 @@ class V2:
     # Returns  0 if `a`, `b` and `c` are collinear.
     # Returns  1 if `c` is on the right of `ab` -> CW.
     @classmethod
-    def rotation(cls, a, b, c): return cls.sign(cls.cross(b - a, c - a))
+    def rotation(cls, a, b, c): return kernel.rotation(
+        a.x, a.y, b.x, b.y, c.x, c.y
+    )
 
     # Returns -1 if `c` (point) if behind `ab` (direction vector).
     # Returns  0 if `c` is inside `ab`.
     # Returns  1 if `c` is in front of `ab`.
-    def position(a, b, c):
-        inside = (V2.dot(a - c, b - c) <= 0)
-        behind = (V2.dot(b - a, c - a) < 0)
-        front = (not behind) and (not inside)
-        return  1 if front \
-          else  0 if inside \
-          else -1 if behind \
-          else None
+    @classmethod
+    def position(cls, a, b, c): return kernel.position(
+        a.x, a.y, b.x, b.y, c.x, c.y
+    )
 
     @classmethod
     def dot(cls, va, vb): return (va.x * vb.x) + (va.y * vb.y)
@@ -60,25 +63,13 @@ class V2:
     @classmethod
     def cross(cls, va, vb): return (va.x * vb.y) - (va.y * vb.x)
 
+    # Returns True if segments [AB] and [CD] intersect. When `b == c`, the
+    # segments are consecutive in a chain and only overlapping counts.
     @classmethod
-    def intersection(cls, a, b, c, d):
-        ca = a - c ; ab = b - a ; cd = d - c
-        denominator = cls.cross(cd, ab)
-
-        if b == c: return (denominator == 0) \
-                      and (cls.position(a, b, d) <= 0)
-
-        if denominator == 0:
-            colinear = (cls.cross(ca, cd) == 0)
-            overlap = (cls.position(a, b, c) == 0) \
-                   or (cls.position(a, b, d) == 0) \
-                   or (cls.position(c, d, a) == 0) \
-                   or (cls.position(c, d, b) == 0)
-            return colinear and overlap
-
-        u = cls.cross(ca, cd) / denominator
-        v = cls.cross(ca, ab) / denominator
-        return (0 <= u <= 1) and (0 <= v <= 1)
+    def intersection(cls, a, b, c, d): return kernel.intersection(
+        a.x, a.y, b.x, b.y, c.x, c.y, d.x, d.y,
+        adjacent = (b == c),
+    )
 
     def __iter__(self):
         yield self.x